@@ -8,9 +8,76 @@ API namespaces inherit from. It includes:
 """
 
 import asyncio
+import copy
 import inspect
+import json
+import random
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
 from typing import TYPE_CHECKING, Union
 
+from .cache import LRUCache, params_key
+from .filters import filter_at_or_before
+
+# Error text that signals an HTTP 429 / rate-limit rejection
+_RL_RE = re.compile(r'429|rate[- ]?limit', re.IGNORECASE)
+# Error text that signals a transient server-side failure worth retrying. Only a
+# status in the "Request failed: <status>" / "status code <status>" position
+# counts, so messages like "limit must be <= 500" aren't retried.
+_TRANSIENT_RE = re.compile(r'(?:request failed:|status(?: code)?[ :=]*)\s*50[0234]\b', re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r'\{[^}]+\}')
+
+# Threads for blocking (synchronous) SDK calls, so they don't stall the event loop
+_SDK_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="dome-sdk")
+
+# Full-jitter backoff added on top of retry_after after a 429 (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+
+_DAY = 24 * 3600
+
+# Recent get_markets searches remembered per status and limit, and how many are needed
+# before their depth is used to fetch several window steps at once
+_WINDOW_HISTORY_SIZE = 100
+_MIN_WINDOW_HISTORY = 10
+
+# Responses are only cached for data ending at least this long before now,
+# since data near the present can still change
+_LIVE_DATA_MARGIN = _DAY
+
+# (start, end) offsets from backtest time for each progressively wider
+# get_markets search window, per requested status
+_WINDOW_OFFSETS = {
+    'open': (
+        (-7 * _DAY, 21 * _DAY),
+        (-14 * _DAY, 42 * _DAY),
+        (-28 * _DAY, 84 * _DAY),
+        (-90 * _DAY, 180 * _DAY),
+        (-180 * _DAY, 365 * _DAY),
+        (-365 * _DAY, 365 * _DAY),
+    ),
+    'closed': (
+        (-14 * _DAY, 0),
+        (-28 * _DAY, 0),
+        (-90 * _DAY, 0),
+        (-180 * _DAY, 0),
+        (-365 * _DAY, 0),
+        (-365 * _DAY, 365 * _DAY),
+    ),
+    None: (
+        (-7 * _DAY, 7 * _DAY),
+        (-14 * _DAY, 14 * _DAY),
+        (-28 * _DAY, 28 * _DAY),
+        (-90 * _DAY, 90 * _DAY),
+        (-180 * _DAY, 180 * _DAY),
+        (-365 * _DAY, 365 * _DAY),
+    ),
+}
+
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
     from ..simulation.clock import SimulationClock
@@ -18,6 +85,171 @@ if TYPE_CHECKING:
     from .rate_limiter import RateLimiter
 
 
+async def invoke_sdk_method(method, params: dict):
+    """
+    Call an SDK method without blocking the event loop.
+    
+    Coroutine functions are awaited directly. Anything else may do blocking
+    HTTP, so it runs on a worker thread; if it hands back a coroutine
+    (e.g. a sync wrapper around an async call) that is awaited here.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(params)
+    
+    result = await asyncio.get_running_loop().run_in_executor(_SDK_POOL, method, params)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def is_rate_limit_error(error_str: str) -> bool:
+    """Check if an SDK error message reports a 429 / rate-limit rejection."""
+    return _RL_RE.search(error_str) is not None
+
+
+def is_transient_error(error_str: str) -> bool:
+    """Check if an SDK error message reports a retryable 5xx (500/502/503/504)."""
+    return _TRANSIENT_RE.search(error_str) is not None
+
+
+def parse_retry_after(error_str: str, default: float = 1):
+    """
+    Extract the server's retry_after (seconds) from a rate-limit error message.
+    
+    The SDK embeds the JSON error body in the exception text, e.g.
+    '... {"error": "Rate Limit Exceeded", "retry_after": 7}'.
+    Returns `default` when no usable value is present.
+    """
+    if "retry_after" not in error_str:
+        return default
+    try:
+        # Try to extract retry_after from JSON in error message
+        json_match = _JSON_OBJECT_RE.search(error_str)
+        if json_match:
+            error_data = json.loads(json_match.group())
+            return error_data.get("retry_after", default)
+    except (ValueError, AttributeError):
+        pass
+    return default
+
+
+def backoff_delay(retry_after: float, attempt: int) -> float:
+    """
+    Seconds to wait before retrying after a 429 or transient server error.
+    
+    Waits at least the server's retry_after (0 for 5xx errors), plus a full-jitter exponential
+    term (uniform in [0, base * 2**attempt], capped) so concurrent clients
+    don't retry in lockstep.
+    """
+    return retry_after + random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+
+
+def search_windows(requested_status, at_time: int, start_override=None, end_override=None) -> list:
+    """
+    Absolute (start, end) get_markets search windows for a status, narrowest first.
+    
+    Args:
+        requested_status: 'open', 'closed', or None (any other value uses None's windows)
+        at_time: Backtest time the offsets are relative to
+        start_override: Caller-supplied start_time pinning every window's start
+        end_override: Caller-supplied end_time pinning every window's end
+    """
+    # Both bounds pinned - every rung would be the same window
+    if start_override is not None and end_override is not None:
+        return [(start_override, end_override)]
+    return [
+        (
+            at_time + start_offset if start_override is None else start_override,
+            at_time + end_offset if end_override is None else end_override,
+        )
+        for start_offset, end_offset in _WINDOW_OFFSETS.get(requested_status, _WINDOW_OFFSETS[None])
+    ]
+
+
+def split_search_windows(windows) -> list:
+    """
+    Split nested, progressively wider (start, end) windows into the ranges each adds.
+    
+    Returns one tuple of ranges per window: the first window whole, then for
+    each wider window only its new past edge and new future edge, so widening
+    never re-fetches pages already scanned. Bounds are inclusive (whole
+    seconds), so each edge stops one second short of the range before it and
+    no market is returned twice. Edges that add nothing (e.g. a bound pinned
+    by the caller) are left out, so a step may be empty.
+    """
+    steps = []
+    prev_start = prev_end = None
+    for window_start, window_end in windows:
+        if prev_start is None:
+            step = ((window_start, window_end),)
+        else:
+            step = tuple(
+                (start, end)
+                for start, end in ((window_start, prev_start - 1), (prev_end + 1, window_end))
+                if start <= end
+            )
+        steps.append(step)
+        prev_start, prev_end = window_start, window_end
+    return steps
+
+
+def _usual_search_depth(history) -> int:
+    """Window steps that ~90% of recent searches needed (1 until there is enough history)."""
+    if len(history) < _MIN_WINDOW_HISTORY:
+        return 1
+    return sorted(history)[int(0.9 * (len(history) - 1))]
+
+
+def resolve_rate_limiter(rate_limiter: Union["RateLimiter", float, None]) -> "RateLimiter":
+    """
+    Normalize a rate_limiter argument to a RateLimiter instance.
+    
+    Accepts a RateLimiter, a float (backward compat: seconds between requests),
+    or None (default to free tier). Parent namespaces resolve it once before
+    building their children so all of them share a single limiter instead of
+    creating one each.
+    """
+    if rate_limiter is None:
+        from .rate_limiter import RateLimiter
+        return RateLimiter(tier="free")
+    if isinstance(rate_limiter, float):
+        # Backward compatibility: the old float rate_limit was the delay between
+        # requests. Honor it as a QPS budget (1.1s -> 1 QPS, 0.05s -> 20 QPS)
+        # instead of always falling back to free-tier limits.
+        from .rate_limiter import RateLimiter
+        qps = max(1, int(1 / rate_limiter)) if rate_limiter > 0 else 1
+        return RateLimiter(tier="free", qps=qps, per_10s=qps * 10)
+    return rate_limiter
+
+
+def _discard_task(task):
+    """Cancel a task whose result is no longer needed, marking a stored failure as retrieved."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _page_has_more(response, page_limit: int) -> bool:
+    """Whether a get_markets page indicates more results at later offsets."""
+    pagination = getattr(response, 'pagination', None)
+    if pagination:
+        if isinstance(pagination, dict):
+            return pagination.get('has_more', False)
+        return getattr(pagination, 'has_more', False)
+    return len(response.markets) >= page_limit
+
+
+class _FilteredPricesResponse:
+    """Fallback price response when the SDK response can't be copied."""
+    
+    __slots__ = ('prices', 'pagination_key')
+    
+    def __init__(self, prices, pagination_key=None):
+        self.prices = prices
+        self.pagination_key = pagination_key
+
+
 class BasePlatformAPI:
     """Base class for platform APIs with shared functionality."""
     
@@ -35,17 +267,7 @@ class BasePlatformAPI:
         self._clock = clock
         self._portfolio = portfolio
         
-        # Handle rate limiter: accept RateLimiter, float (backward compat), or None (default to free tier)
-        if rate_limiter is None:
-            from .rate_limiter import RateLimiter
-            self._rate_limiter = RateLimiter(tier="free")
-        elif isinstance(rate_limiter, float):
-            # Backward compatibility: convert old float rate_limit to a simple limiter
-            # For 1.1s delay, that's roughly 0.9 QPS, so use free tier
-            from .rate_limiter import RateLimiter
-            self._rate_limiter = RateLimiter(tier="free")
-        else:
-            self._rate_limiter = rate_limiter
+        self._rate_limiter = resolve_rate_limiter(rate_limiter)
         
         # UX/Logging (set by DomeBacktestClient)
         self._verbose = False
@@ -53,6 +275,18 @@ class BasePlatformAPI:
         self._on_api_call = None
         self._dome_client = None
         
+        # Finished get_markets searches per (at_time, status, params), for past backtest times
+        self._markets_cache = LRUCache(maxsize=256)
+        
+        # Other endpoint responses whose data is fixed in the past (see _call_api_cached)
+        self._response_cache = LRUCache(maxsize=1024)
+        
+        # Window steps each recent get_markets search needed, per (status, limit)
+        self._window_history = {}
+        
+        # In-flight requests, so identical concurrent calls share one round-trip
+        self._inflight = {}
+        
         # Initialize order simulation components (lazy initialization)
         self._orderbook_sim = None
         self._order_manager = None
@@ -72,11 +306,9 @@ class BasePlatformAPI:
         """
         Call API method with rate limiting, handling both sync and async methods.
         
-        Handles rate limit errors (429) with exponential backoff retry.
+        Handles rate limit errors (429) and transient server errors (5xx)
+        with exponential backoff retry.
         """
-        import time
-        from datetime import datetime
-        
         # Extract endpoint name for logging
         endpoint_name = getattr(method, '__name__', 'unknown')
         if hasattr(method, '__self__'):
@@ -104,10 +336,8 @@ class BasePlatformAPI:
             await self._rate_limiter.acquire()
             
             try:
-                result = method(params)
-                # If the SDK returns a coroutine, await it
-                if inspect.iscoroutine(result):
-                    result = await result
+                # Sync SDK methods run on a worker thread, async ones are awaited
+                result = await invoke_sdk_method(method, params)
                 
                 # Log response if verbose
                 if self._verbose and self._log_level == "DEBUG":
@@ -128,32 +358,274 @@ class BasePlatformAPI:
             except ValueError as e:
                 # Check if it's a rate limit error
                 error_str = str(e)
-                if "429" in error_str or "Rate Limit" in error_str or "rate limit" in error_str.lower():
+                if is_rate_limit_error(error_str):
                     if attempt < max_retries - 1:
                         # Extract retry_after from error if available
-                        retry_after = 1  # Default 1 second
-                        if "retry_after" in error_str:
-                            try:
-                                import json
-                                import re
-                                # Try to extract retry_after from JSON in error message
-                                json_match = re.search(r'\{[^}]+\}', error_str)
-                                if json_match:
-                                    error_data = json.loads(json_match.group())
-                                    retry_after = error_data.get("retry_after", 1)
-                            except:
-                                pass
+                        retry_after = parse_retry_after(error_str, default=1)
                         
-                        wait_time = retry_after + (attempt * 2)  # Exponential backoff
-                        print(f"[INFO] Rate limit hit, waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        await asyncio.sleep(wait_time)
+                        wait_time = backoff_delay(retry_after, attempt)
+                        print(f"[INFO] Rate limit hit, waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                        if hasattr(self._rate_limiter, 'pause'):
+                            # Pause the shared limiter so other namespaces back off too;
+                            # the next acquire() waits out the pause
+                            self._rate_limiter.pause(wait_time)
+                        else:
+                            await asyncio.sleep(wait_time)
                         continue
                     else:
                         raise ValueError(f"Rate limit exceeded after {max_retries} retries. {error_str}")
+                elif is_transient_error(error_str) and attempt < max_retries - 1:
+                    # Server hiccup: retry after a full-jitter delay so callers don't retry in waves
+                    wait_time = backoff_delay(0, attempt)
+                    print(f"[INFO] Server error, waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                    await asyncio.sleep(wait_time)
+                    continue
                 else:
-                    # Not a rate limit error, re-raise
+                    # Not a retryable error, re-raise
                     raise
 
+    async def _call_api_shared(self, method, params: dict):
+        """
+        Call API method via _call_api, coalescing identical concurrent requests.
+        
+        Strategies often ask for the same trades/orderbook window from several
+        coroutines within one tick. While a request is in flight, callers with
+        the same endpoint and params await that request instead of issuing
+        their own, so each distinct request costs a single rate-limited call.
+        """
+        key = (getattr(method, '__name__', repr(method)), params_key(params))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call_api(method, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _call_api_cached(self, method, params: dict, as_of: int):
+        """
+        Call API method via _call_api_shared, memoizing responses for past data.
+        
+        Strategy loops often re-request the same fixed price or candlestick
+        range on later ticks. When everything the response covers lies more
+        than a day in the past it can't change, so it is kept in an LRU cache
+        keyed by endpoint and params. Cached responses are shared between callers.
+        
+        Requests reaching up to the backtest time itself (a price "now", a
+        range capped at the tick) are not cached: their params move with
+        every tick, so the key would never be seen again.
+        
+        Args:
+            method: SDK method to call
+            params: Request params (already capped at backtest time)
+            as_of: Latest timestamp (seconds) the response can depend on
+        """
+        if as_of >= self._clock.current_time or as_of >= time.time() - _LIVE_DATA_MARGIN:
+            return await self._call_api_shared(method, params)
+        
+        key = (getattr(method, '__name__', repr(method)), params_key(params))
+        response = self._response_cache.get(key)
+        if response is None:
+            response = await self._call_api_shared(method, params)
+            self._response_cache.put(key, response)
+        return response
+
+    async def _iter_market_pages(self, api_params: dict, page_limit: int, max_pages: int):
+        """
+        Yield successive get_markets pages for one search window, in offset order.
+        
+        Only one page is in flight at a time: the next page is requested when
+        the caller asks for it, so a caller that stops early (limit reached,
+        nothing matching) never pays for pages it won't use.
+        Stops at the first empty page, when the API reports no more results,
+        or after max_pages pages.
+        """
+        offset = 0
+        for _ in range(max_pages):
+            response = await self._call_api(
+                self._real_api.markets.get_markets, {**api_params, 'offset': offset, 'limit': page_limit}
+            )
+            if not response.markets:
+                return
+            
+            yield response
+            
+            if not _page_has_more(response, page_limit):
+                return
+            offset += len(response.markets)
+
+    async def _search_markets(
+        self,
+        params: dict,
+        requested_status: str,
+        at_time: int,
+        original_limit: int,
+        market_id,
+    ) -> list:
+        """
+        Search progressively wider time windows for markets matching a status at at_time.
+        
+        Shared get_markets core for every platform. Each wider window only
+        fetches its new past and future edges, concurrently.
+        
+        Args:
+            params: API params (without status); start_time/end_time pin every window
+            requested_status: 'open', 'closed', or None for any status
+            at_time: Backtest time to evaluate existence and status at
+            original_limit: Markets wanted; falsy means up to ~500
+            market_id: Callable returning a market's dedupe key (or None)
+        
+        Returns:
+            Raw SDK markets in search order, deduplicated, at most original_limit.
+            The list may be shared with later calls and must not be mutated.
+        """
+        search_key = (
+            '_search_markets',
+            at_time,
+            requested_status,
+            params_key({key: value for key, value in params.items() if key != 'offset'}),
+        )
+        
+        # Repeated searches at the same past backtest time (e.g. several indicators
+        # per tick) reuse the result
+        cacheable = at_time < time.time() - _LIVE_DATA_MARGIN
+        if cacheable:
+            cached = self._markets_cache.get(search_key)
+            if cached is not None:
+                return cached
+        
+        # Identical searches issued concurrently share one run
+        task = self._inflight.get(search_key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_market_search(
+                params.copy(), requested_status, at_time, original_limit, market_id
+            ))
+            self._inflight[search_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(search_key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the search for the others
+        found = await asyncio.shield(task)
+        if cacheable:
+            self._markets_cache.put(search_key, found)
+        return found
+
+    async def _run_market_search(
+        self,
+        params: dict,
+        requested_status: str,
+        at_time: int,
+        original_limit: int,
+        market_id,
+    ) -> list:
+        """Run the window search behind _search_markets, without caching or coalescing."""
+        seen_market_ids = set()
+        
+        matches_status = self._status_predicate(requested_status)
+        
+        def accept(market) -> bool:
+            return matches_status(market, at_time)
+        
+        wanted = original_limit or 500
+        found = []
+        
+        # Smart progressive time window expansion; caller-supplied bounds override every window
+        windows = search_windows(requested_status, at_time, params.get('start_time'), params.get('end_time'))
+        steps = split_search_windows(windows)
+        
+        # Fetch as many steps up front as recent searches usually needed; results
+        # are still merged in window order, so the outcome doesn't depend on history
+        history = self._window_history.setdefault((requested_status, wanted), deque(maxlen=_WINDOW_HISTORY_SIZE))
+        batch_size = _usual_search_depth(history)
+        step_index = 0
+        
+        while step_index < len(steps):
+            batch = steps[step_index:step_index + batch_size]
+            batch_size = 1
+            needed = wanted - len(found)
+            
+            # A wider window's new past and future edges are independent - fetch them
+            # concurrently, but merge them in window order
+            tasks = iter([
+                asyncio.ensure_future(
+                    self._fetch_window({**params, 'start_time': start, 'end_time': end}, accept, needed)
+                )
+                for step in batch
+                for start, end in step
+            ])
+            
+            try:
+                for step in batch:
+                    step_index += 1
+                    for task in islice(tasks, len(step)):
+                        for market in await task:
+                            key = market_id(market)
+                            if key:
+                                if key in seen_market_ids:
+                                    continue
+                                seen_market_ids.add(key)
+                            found.append(market)
+                            # Stop at the limit rather than collecting extras to slice off later
+                            if len(found) == original_limit:
+                                break
+                        if len(found) == original_limit:
+                            break
+                    
+                    if len(found) >= wanted:
+                        break
+            finally:
+                # Ranges later in merge order can't contribute once the limit is met
+                for task in tasks:
+                    _discard_task(task)
+            
+            if len(found) >= wanted:
+                break
+        
+        history.append(max(step_index, 1))
+        return found
+
+    async def _fetch_window(self, api_params: dict, accept, needed: int) -> list:
+        """
+        Page through one search range and return the markets passing `accept`.
+        
+        Markets are returned in API order. Paging stops once `needed` markets
+        matched, when the API runs out of results, after 20 pages, or when
+        the first 5 pages matched nothing.
+        """
+        page_limit = min(api_params.get('limit', 100), 100)  # API max is 100
+        page_count = 0
+        matches = []
+        
+        pages = self._iter_market_pages(api_params, page_limit, max_pages=20)
+        try:
+            async for response in pages:
+                page_count += 1
+                matches.extend(market for market in response.markets if accept(market))
+                
+                if matches:
+                    if needed and len(matches) >= needed:
+                        break
+                elif page_count >= 5:
+                    # While nothing has matched, every page so far was empty
+                    break
+        finally:
+            await pages.aclose()
+        
+        return matches
+
+    def _status_predicate(self, requested_status):
+        """
+        Return the (market, at_time) check for a get_markets status filter.
+        
+        Picked once per request so per-market filtering doesn't re-compare
+        the status string. The open/closed checks include the existence check.
+        """
+        if requested_status == 'open':
+            return self._market_was_open_at_time
+        if requested_status == 'closed':
+            return self._market_was_closed_at_time
+        return self._market_existed_at_time
+
     def _market_existed_at_time(self, market, at_time: int) -> bool:
         """Check if market existed (was created) at the given time."""
         return market.start_time <= at_time
@@ -187,3 +659,52 @@ class BasePlatformAPI:
             multiplier = 1000 if is_milliseconds else 1
             params[time_key] = min(params[time_key], self._clock.current_time * multiplier)
 
+    def _cap_time_range(self, params: dict, is_milliseconds: bool = False, default_end: bool = False):
+        """
+        Cap start_time/end_time at the current backtest time.
+        
+        Args:
+            params: Parameter dict to modify
+            is_milliseconds: If True, the endpoint takes times in milliseconds
+            default_end: If True, set end_time to backtest time when it is missing
+        """
+        if default_end and 'end_time' not in params:
+            params['end_time'] = self._clock.current_time * (1000 if is_milliseconds else 1)
+        self._cap_time_at_backtest(params, 'end_time', is_milliseconds)
+        self._cap_time_at_backtest(params, 'start_time', is_milliseconds)
+
+    async def _get_prices_capped(self, api_fn, params: dict):
+        """
+        Fetch a crypto price series and drop prices after backtest time.
+        
+        Shared by the Binance and Chainlink endpoints, which only differ in
+        currency validation and the SDK method they call.
+        
+        Args:
+            api_fn: SDK method returning a response with a `prices` list
+            params: Request params (start_time/end_time in milliseconds)
+        """
+        # Cap end_time and start_time at backtest time (prices use milliseconds)
+        self._cap_time_range(params, is_milliseconds=True)
+        
+        response = await self._call_api(api_fn, params)
+        
+        # CRITICAL: Filter response data to remove prices after backtest time
+        # Prices use 'timestamp' field (in milliseconds), oldest first
+        if hasattr(response, 'prices') and response.prices:
+            at_time_ms = self._clock.current_time * 1000  # Convert to milliseconds
+            filtered_prices = filter_at_or_before(response.prices, 'timestamp', at_time_ms, order="asc")
+            
+            # Create filtered response
+            try:
+                if hasattr(response, '__dict__'):
+                    filtered_response = copy.copy(response)
+                    filtered_response.prices = filtered_prices
+                    return filtered_response
+            except (AttributeError, TypeError, ValueError):
+                # Fallback if copy or assignment fails (frozen pydantic models raise
+                # ValidationError, a ValueError) - create simple response object
+                pagination_key = getattr(response, 'pagination_key', None)
+                return _FilteredPricesResponse(filtered_prices, pagination_key)
+        
+        return response
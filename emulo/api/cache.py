@@ -0,0 +1,116 @@
+"""Caching helpers for historical API responses.
+
+Historical data for a window that is fully in the past does not change, so
+backtests can reuse responses instead of re-fetching identical requests.
+LRUCache keeps them for one run; PersistentCache keeps them on disk across runs.
+"""
+
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+
+
+def params_key(params: dict) -> tuple:
+    """Build a hashable, order-independent cache key from request params."""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in params.items()
+    ))
+
+
+class LRUCache:
+    """Least-recently-used cache holding at most `maxsize` entries."""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used), or default."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._data.clear()
+    
+    def __contains__(self, key) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class PersistentCache:
+    """
+    SQLite-backed cache of pickled values that survives across backtest runs.
+    
+    Only point this at a directory you own: entries are unpickled on read.
+    Values that can't be pickled are silently not cached, and unreadable
+    entries are treated as misses. After close() the cache can still be
+    used; the database is reopened on the next get/put.
+    """
+    
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._conn = None
+        self._connect()
+    
+    def _connect(self):
+        """Return the open database connection, opening it if needed."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+            )
+            self._conn.commit()
+        return self._conn
+    
+    def get(self, key: str, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        row = self._connect().execute(
+            "SELECT value, expires FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return default
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            # Stale entry from an incompatible SDK/package version
+            return default
+    
+    def put(self, key: str, value, ttl: float = None):
+        """Store value under key; it expires after `ttl` seconds (None = never)."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        expires = time.time() + ttl if ttl is not None else None
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+            (key, blob, expires),
+        )
+        conn.commit()
+    
+    def close(self):
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -167,6 +167,11 @@ class DomeBacktestClient:
                     api_obj._on_api_call = self.on_api_call
                     api_obj._dome_client = self
     
+    async def close(self):
+        """Release pooled HTTP connections and cache files held by the API namespaces."""
+        await self.kalshi.close()
+        await self.matching_markets.close()
+    
     def _adapt_strategy(self, strategy, method: Optional[str] = None):
         """
         Adapt a class-based strategy to async function interface.
@@ -305,6 +310,9 @@ class DomeBacktestClient:
         if effective_end_time is None:
             raise ValueError("end_time must be provided either in config or as parameter to run()")
         
+        # Release connections held by namespaces from a previous run
+        await self.close()
+        
         # Reset clock and portfolio for fresh run
         self._clock = SimulationClock(self.start_time)
         self._portfolio = Portfolio(
@@ -316,7 +324,11 @@ class DomeBacktestClient:
         self.portfolio = self._portfolio  # Update reference
         self.polymarket = PolymarketNamespace(self._real_client, self._clock, self._portfolio, self._rate_limiter)
         self.kalshi = KalshiNamespace(self._real_client, self._clock, self._portfolio, self._rate_limiter)
-        self.matching_markets = MatchingMarketsNamespace(self._real_client, self._clock, self._portfolio, self._rate_limiter)
+        # Keep the client's on-disk matching-markets cache rather than opening another
+        self.matching_markets = MatchingMarketsNamespace(
+            self._real_client, self._clock, self._portfolio, self._rate_limiter,
+            disk_cache=self.matching_markets._disk_cache,
+        )
         self.crypto_prices = CryptoPricesNamespace(self._real_client, self._clock, self._portfolio, self._rate_limiter)
         
         # Re-apply verbose settings after reset
@@ -332,7 +344,7 @@ class DomeBacktestClient:
                         # Try polymarket first
                         data = await dome.polymarket.markets.get_market_price({"token_id": position_key})
                         prices[position_key] = Decimal(str(data.price))
-                    except:
+                    except Exception:
                         try:
                             # Try kalshi - check if this is a Kalshi position (format: "ticker:YES" or "ticker:NO")
                             if ":" in position_key:
@@ -399,81 +411,85 @@ class DomeBacktestClient:
                                             no_price_cents = Decimal(str(no_bids[0][0]))
                                             yes_price = Decimal(1) - (no_price_cents / Decimal(100))
                                             prices[position_key] = yes_price
-                                except:
+                                except Exception:
                                     pass
-                        except:
+                        except Exception:
                             pass
                 return prices
             get_prices = auto_get_prices
         
-        equity_curve = []
-        
-        # Calculate total ticks for progress
-        total_ticks = ((effective_end_time - self.start_time) // self.step) + 1
-        current_tick = 0
-        
-        from datetime import datetime
-        
-        while self._clock.current_time <= effective_end_time:
-            current_tick += 1
-            current_time_str = datetime.fromtimestamp(self._clock.current_time).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Show progress if verbose
-            if self.verbose:
-                prices = await get_prices(self)
-                current_value = self._portfolio.get_value(prices)
-                print(f"\n[Tick {current_tick}/{total_ticks}] {current_time_str} | "
-                      f"Cash: ${self._portfolio.cash:,.2f} | Value: ${current_value:,.2f} | "
-                      f"Positions: {len(self._portfolio.positions)}")
+        try:
+            equity_curve = []
             
-            # Call on_tick callback if provided
-            if self.on_tick:
-                await self.on_tick(self, self._portfolio)
+            # Calculate total ticks for progress
+            total_ticks = ((effective_end_time - self.start_time) // self.step) + 1
+            current_tick = 0
             
-            # Process WebSocket events for current time
-            await self.polymarket.websocket.process_events()
+            from datetime import datetime
             
-            # Run strategy (always with dome parameter)
-            await strategy(self)
-            
-            # Process pending limit orders (GTC/GTD)
-            if hasattr(self.polymarket.markets, '_order_manager'):
-                if self.polymarket.markets._order_manager:
-                    await self.polymarket.markets._order_manager.process_pending_orders("polymarket")
-            if hasattr(self.kalshi.markets, '_order_manager'):
-                if self.kalshi.markets._order_manager:
-                    await self.kalshi.markets._order_manager.process_pending_orders("kalshi")
-            
-            # Record equity
-            prices = await get_prices(self)
-            value = self._portfolio.get_value(prices)
-            
-            # Calculate positions value for interest accrual
-            positions_value = sum(
-                qty * prices.get(token_id, Decimal(0))
-                for token_id, qty in self._portfolio.positions.items()
-            )
-            
-            # Accrue daily interest (Kalshi)
-            if self._portfolio.enable_interest and self._portfolio.interest_accrual:
-                daily_interest = self._portfolio.interest_accrual.accrue_interest(
-                    cash_balance=self._portfolio.cash,
-                    positions_value=positions_value,
-                    current_timestamp=self._clock.current_time
+            while self._clock.current_time <= effective_end_time:
+                current_tick += 1
+                current_time_str = datetime.fromtimestamp(self._clock.current_time).strftime('%Y-%m-%d %H:%M:%S')
+                
+                # Show progress if verbose
+                if self.verbose:
+                    prices = await get_prices(self)
+                    current_value = self._portfolio.get_value(prices)
+                    print(f"\n[Tick {current_tick}/{total_ticks}] {current_time_str} | "
+                          f"Cash: ${self._portfolio.cash:,.2f} | Value: ${current_value:,.2f} | "
+                          f"Positions: {len(self._portfolio.positions)}")
+                
+                # Call on_tick callback if provided
+                if self.on_tick:
+                    await self.on_tick(self, self._portfolio)
+                
+                # Process WebSocket events for current time
+                await self.polymarket.websocket.process_events()
+                
+                # Run strategy (always with dome parameter)
+                await strategy(self)
+                
+                # Process pending limit orders (GTC/GTD)
+                if hasattr(self.polymarket.markets, '_order_manager'):
+                    if self.polymarket.markets._order_manager:
+                        await self.polymarket.markets._order_manager.process_pending_orders("polymarket")
+                if hasattr(self.kalshi.markets, '_order_manager'):
+                    if self.kalshi.markets._order_manager:
+                        await self.kalshi.markets._order_manager.process_pending_orders("kalshi")
+                
+                # Record equity
+                prices = await get_prices(self)
+                value = self._portfolio.get_value(prices)
+                
+                # Calculate positions value for interest accrual
+                positions_value = sum(
+                    qty * prices.get(token_id, Decimal(0))
+                    for token_id, qty in self._portfolio.positions.items()
                 )
-                if daily_interest > 0:
-                    # Add interest to cash (paid monthly, but we accrue daily)
-                    # For backtesting, we can add it daily or track separately
-                    self._portfolio.cash += daily_interest
-            
-            equity_curve.append((self._clock.current_time, value))
+                
+                # Accrue daily interest (Kalshi)
+                if self._portfolio.enable_interest and self._portfolio.interest_accrual:
+                    daily_interest = self._portfolio.interest_accrual.accrue_interest(
+                        cash_balance=self._portfolio.cash,
+                        positions_value=positions_value,
+                        current_timestamp=self._clock.current_time
+                    )
+                    if daily_interest > 0:
+                        # Add interest to cash (paid monthly, but we accrue daily)
+                        # For backtesting, we can add it daily or track separately
+                        self._portfolio.cash += daily_interest
+                
+                equity_curve.append((self._clock.current_time, value))
+                
+                # Advance time
+                self._clock.advance_by(self.step)
             
-            # Advance time
-            self._clock.advance_by(self.step)
-        
-        # Final valuation
-        final_prices = await get_prices(self)
-        final_value = self._portfolio.get_value(final_prices)
+            # Final valuation
+            final_prices = await get_prices(self)
+            final_value = self._portfolio.get_value(final_prices)
+        finally:
+            # Release pooled HTTP connections opened during the run, even if it failed
+            await self.close()
         
         # Calculate total interest earned
         total_interest = Decimal(0)
@@ -1,5 +1,6 @@
 """Binance crypto prices namespace: dome.crypto_prices.binance.*"""
 
+import re
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
     from ...simulation.portfolio import Portfolio
     from ..rate_limiter import RateLimiter
 
+_CURRENCY_RE = re.compile(r'^[a-z0-9]+$')
+
 
 class BinanceNamespace(BasePlatformAPI):
     """dome.crypto_prices.binance.* namespace - matches Dome's structure exactly."""
@@ -43,54 +46,11 @@ class BinanceNamespace(BasePlatformAPI):
             raise ValueError("currency is required for get_binance_prices")
         
         # Validate currency format (lowercase alphanumeric, no separators)
-        import re
         currency = params.get('currency')
-        if not re.match(r'^[a-z0-9]+$', currency):
+        if not _CURRENCY_RE.match(currency):
             raise ValueError(
                 f"currency must be lowercase alphanumeric with no separators. "
                 f"Got: {currency}. Example: btcusdt, ethusdt"
             )
         
-        # Cap end_time at backtest time (Binance prices use milliseconds)
-        self._cap_time_at_backtest(params, 'end_time', is_milliseconds=True)
-        
-        # Cap start_time if provided
-        if 'start_time' in params:
-            self._cap_time_at_backtest(params, 'start_time', is_milliseconds=True)
-        
-        response = await self._call_api(self._real_api.binance.get_binance_prices, params)
-        
-        # CRITICAL: Filter response data to remove prices after backtest time
-        # Binance prices use 'timestamp' field (in milliseconds)
-        if hasattr(response, 'prices') and response.prices:
-            at_time_ms = self._clock.current_time * 1000  # Convert to milliseconds
-            filtered_prices = []
-            for price in response.prices:
-                # Get timestamp from price (field name: timestamp, in milliseconds)
-                price_timestamp = None
-                if hasattr(price, 'timestamp'):
-                    price_timestamp = price.timestamp
-                elif isinstance(price, dict):
-                    price_timestamp = price.get('timestamp')
-                
-                # Only include prices that occurred at or before backtest time
-                if price_timestamp is not None and price_timestamp <= at_time_ms:
-                    filtered_prices.append(price)
-            
-            # Create filtered response
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.prices = filtered_prices
-                    return filtered_response
-            except:
-                class FilteredResponse:
-                    def __init__(self, prices, pagination_key=None):
-                        self.prices = prices
-                        self.pagination_key = pagination_key
-                pagination_key = getattr(response, 'pagination_key', None)
-                return FilteredResponse(filtered_prices, pagination_key)
-        
-        return response
-
+        return await self._get_prices_capped(self._real_api.binance.get_binance_prices, params)
@@ -0,0 +1,85 @@
+"""Shared helpers for capping historical responses at backtest time.
+
+Most Dome endpoints return a list of timestamped records (prices, trades,
+orderbook snapshots, ...). Every namespace has to drop the records that
+occurred after the current simulation time, so the logic lives here once
+instead of being repeated per endpoint.
+"""
+
+import copy
+import dataclasses
+from bisect import bisect_left, bisect_right
+from operator import ge, le
+
+
+def get_timestamp(item, field: str):
+    """Read a timestamp field from an SDK object or a plain dict."""
+    value = getattr(item, field, None)
+    if value is None and isinstance(item, dict):
+        value = item.get(field)
+    return value
+
+
+def filter_at_or_before(items: list, field: str, cap: int, order: str = None) -> list:
+    """
+    Keep only the records whose timestamp is at or before `cap`.
+
+    Args:
+        items: Records returned by the API (SDK objects or dicts)
+        field: Name of the timestamp field (e.g., 'timestamp', 'created_time')
+        cap: Latest allowed timestamp, in the same unit as the field
+        order: "asc" if the API returns records oldest-first, "desc" if
+            newest-first. After one pass confirms the series really is in
+            that order, the cutoff is found by binary search and the result
+            is a single slice. Out-of-order series, and None (default),
+            are filtered record by record.
+
+    Returns:
+        New list with the surviving records, in their original order.
+        Records without a timestamp are dropped.
+    """
+    if order and items:
+        stamps = [get_timestamp(item, field) for item in items]
+        try:
+            # Checking every neighbour pair, not just the ends - one record out
+            # of place would otherwise let a later one through the cutoff
+            if order == "asc":
+                if all(map(le, stamps, stamps[1:])):
+                    return items[:bisect_right(stamps, cap)]
+            elif order == "desc":
+                if all(map(ge, stamps, stamps[1:])):
+                    # Negated, a newest-first series reads as ascending
+                    return items[bisect_left([-ts for ts in stamps], -cap):]
+        except TypeError:
+            # Records missing a timestamp - fall back to the scan
+            pass
+    
+    return [
+        item for item in items
+        if (ts := get_timestamp(item, field)) is not None and ts <= cap
+    ]
+
+
+def replace_records(response, field: str, records: list):
+    """
+    Return a copy of `response` with `field` set to `records`.
+    
+    Uses the response type's own copy API where there is one -
+    dataclasses.replace or pydantic's model_copy - and a shallow copy.copy
+    otherwise. The original response is left untouched.
+    
+    Returns:
+        The updated copy, or None if the response can't be copied or
+        doesn't accept the attribute (callers then build their own object).
+    """
+    try:
+        if dataclasses.is_dataclass(response) and not isinstance(response, type):
+            return dataclasses.replace(response, **{field: records})
+        model_copy = getattr(response, 'model_copy', None)
+        if model_copy is not None:
+            return model_copy(update={field: records})
+        clone = copy.copy(response)
+        setattr(clone, field, records)
+        return clone
+    except (AttributeError, TypeError, ValueError):
+        return None
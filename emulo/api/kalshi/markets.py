@@ -1,6 +1,7 @@
 """Kalshi markets namespace: dome.kalshi.markets.*"""
 
 from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
@@ -12,6 +13,21 @@ if TYPE_CHECKING:
     from ...simulation.portfolio import Portfolio
     from ..rate_limiter import RateLimiter
 
+_ONE = Decimal(1)
+_CENTS_PER_DOLLAR = Decimal(100)
+
+# C-level attribute readers for the per-market dedupe key
+_get_market_ticker = attrgetter('market_ticker')
+_get_event_ticker = attrgetter('event_ticker')
+
+
+def _market_id(market):
+    """Dedupe key for a Kalshi market."""
+    try:
+        return _get_market_ticker(market) or _get_event_ticker(market)
+    except AttributeError:
+        return getattr(market, 'market_ticker', None) or getattr(market, 'event_ticker', None)
+
 
 class KalshiMarketsNamespace(BasePlatformAPI):
     """dome.kalshi.markets.* namespace - matches Dome's structure exactly."""
@@ -50,132 +66,65 @@ class KalshiMarketsNamespace(BasePlatformAPI):
         requested_status = params.pop('status', None)
         original_limit = params.get('limit', 100)
         
-        base_window = 7 * 24 * 3600
-        if requested_status == 'open':
-            time_windows = [
-                (at_time - base_window, at_time + base_window * 3),
-                (at_time - base_window * 2, at_time + base_window * 6),
-                (at_time - base_window * 4, at_time + base_window * 12),
-                (at_time - (90 * 24 * 3600), at_time + (180 * 24 * 3600)),
-                (at_time - (180 * 24 * 3600), at_time + (365 * 24 * 3600)),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
-        elif requested_status == 'closed':
-            time_windows = [
-                (at_time - base_window * 2, at_time),
-                (at_time - base_window * 4, at_time),
-                (at_time - (90 * 24 * 3600), at_time),
-                (at_time - (180 * 24 * 3600), at_time),
-                (at_time - (365 * 24 * 3600), at_time),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
-        else:
-            time_windows = [
-                (at_time - base_window, at_time + base_window),
-                (at_time - base_window * 2, at_time + base_window * 2),
-                (at_time - base_window * 4, at_time + base_window * 4),
-                (at_time - (90 * 24 * 3600), at_time + (90 * 24 * 3600)),
-                (at_time - (180 * 24 * 3600), at_time + (180 * 24 * 3600)),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
+        # Explicit tickers already pin the result set - no need to scan time windows
+        if params.get('market_ticker') or params.get('event_ticker'):
+            return await self._get_markets_by_ticker(params, requested_status, at_time)
+        
+        markets = await self._search_markets(
+            params, requested_status, at_time, original_limit, _market_id
+        )
+        historical_markets = HistoricalKalshiMarket.from_markets(markets, at_time)
+        
+        return self._markets_response(historical_markets, at_time)
+
+    def _markets_response(self, historical_markets: list, at_time: int) -> HistoricalKalshiMarketsResponse:
+        """Wrap converted markets in the get_markets response type."""
+        return HistoricalKalshiMarketsResponse(
+            markets=historical_markets,
+            total_at_time=len(historical_markets),
+            backtest_time=at_time,
+        )
+
+    async def _get_markets_by_ticker(
+        self,
+        params: dict,
+        requested_status: str,
+        at_time: int,
+    ) -> HistoricalKalshiMarketsResponse:
+        """
+        Look up get_markets by market_ticker/event_ticker without time windows.
         
+        The tickers already pin the result set, so pages are read in offset
+        order until the API runs out of results or `limit` markets match.
+        """
+        wanted = params.get('limit', 100)
+        matches_status = self._status_predicate(requested_status)
         seen_market_ids = set()
-        filtered_markets = []
+        markets = []
         
-        for window_start, window_end in time_windows:
-            if 'start_time' in params:
-                window_start = params['start_time']
-            if 'end_time' in params:
-                window_end = params['end_time']
-            
-            api_params = params.copy()
-            api_params['start_time'] = window_start
-            api_params['end_time'] = window_end
-            
-            offset = 0
-            limit = api_params.get('limit', 100)
-            page_count = 0
-            max_pages_per_window = 20
-            consecutive_empty_pages = 0
-            markets_found_in_this_window = 0
-            
-            while page_count < max_pages_per_window:
-                api_params['offset'] = offset
-                api_params['limit'] = min(limit, 100)
-                
-                response = await self._call_api(self._real_api.markets.get_markets, api_params)
-                
-                if not response.markets:
-                    break
-                
-                page_count += 1
-                new_markets_in_window = 0
-                
+        pages = self._iter_market_pages(params, 100, max_pages=20)  # API max is 100 per page
+        try:
+            async for response in pages:
                 for market in response.markets:
-                    market_id = getattr(market, 'market_ticker', None) or getattr(market, 'event_ticker', None)
-                    if market_id and market_id in seen_market_ids:
-                        continue
-                    
-                    if not self._market_existed_at_time(market, at_time):
+                    if not matches_status(market, at_time):
                         continue
-                    
-                    if requested_status == 'open':
-                        if not self._market_was_open_at_time(market, at_time):
+                    # Offset pages can overlap if the listing shifts between requests
+                    key = _market_id(market)
+                    if key:
+                        if key in seen_market_ids:
                             continue
-                    elif requested_status == 'closed':
-                        if not self._market_was_closed_at_time(market, at_time):
-                            continue
-                    
-                    filtered_markets.append(market)
-                    if market_id:
-                        seen_market_ids.add(market_id)
-                    new_markets_in_window += 1
-                    markets_found_in_this_window += 1
-                
-                if original_limit and len(filtered_markets) >= original_limit:
-                    break
-                
-                if hasattr(response, 'pagination') and response.pagination:
-                    if isinstance(response.pagination, dict):
-                        has_more = response.pagination.get('has_more', False)
-                    else:
-                        has_more = getattr(response.pagination, 'has_more', False)
-                    if not has_more:
-                        break
-                    offset += len(response.markets)
-                else:
-                    if len(response.markets) < api_params['limit']:
-                        break
-                    offset += len(response.markets)
-                
-                if new_markets_in_window == 0:
-                    consecutive_empty_pages += 1
-                    if (consecutive_empty_pages >= 3 and 
-                        page_count >= 5 and 
-                        markets_found_in_this_window == 0):
+                        seen_market_ids.add(key)
+                    markets.append(market)
+                    if len(markets) >= wanted:
                         break
-                else:
-                    consecutive_empty_pages = 0
-            
-            if original_limit and len(filtered_markets) >= original_limit:
-                break
-            
-            if not original_limit and len(filtered_markets) >= 500:
-                break
-        
-        historical_markets = []
-        for market in filtered_markets:
-            historical_market = HistoricalKalshiMarket.from_market(market, at_time)
-            historical_markets.append(historical_market)
+                if len(markets) >= wanted:
+                    break
+        finally:
+            await pages.aclose()
         
-        if original_limit and original_limit < len(historical_markets):
-            historical_markets = historical_markets[:original_limit]
+        historical_markets = HistoricalKalshiMarket.from_markets(markets, at_time)
         
-        return HistoricalKalshiMarketsResponse(
-            markets=historical_markets,
-            total_at_time=len(historical_markets),
-            backtest_time=at_time,
-        )
+        return self._markets_response(historical_markets, at_time)
 
     async def create_order(
         self,
@@ -216,12 +165,15 @@ class KalshiMarketsNamespace(BasePlatformAPI):
                 yes_price=75  # cents
             )
         """
+        side_lower = side.lower()
+        action_lower = action.lower()
+        
         # Validate side
-        if side.lower() not in ["yes", "no"]:
+        if side_lower not in ["yes", "no"]:
             raise ValueError(f"side must be 'yes' or 'no', got: {side}")
         
         # Validate action
-        if action.lower() not in ["buy", "sell"]:
+        if action_lower not in ["buy", "sell"]:
             raise ValueError(f"action must be 'buy' or 'sell', got: {action}")
         
         # Validate order_type
@@ -230,23 +182,20 @@ class KalshiMarketsNamespace(BasePlatformAPI):
         
         # Validate price for limit orders
         if order_type == "limit":
-            if side.lower() == "yes" and yes_price is None:
+            if side_lower == "yes" and yes_price is None:
                 raise ValueError("yes_price is required for YES side limit orders")
-            if side.lower() == "no" and no_price is None:
+            if side_lower == "no" and no_price is None:
                 raise ValueError("no_price is required for NO side limit orders")
             if yes_price is not None and (yes_price < 0 or yes_price > 100):
                 raise ValueError(f"yes_price must be between 0-100 cents, got: {yes_price}")
             if no_price is not None and (no_price < 0 or no_price > 100):
                 raise ValueError(f"no_price must be between 0-100 cents, got: {no_price}")
         
-        # Get price (convert cents to decimal)
+        # Get price (convert cents to 0-1 decimal)
         if order_type == "market":
             limit_price = None
         else:
-            if side.lower() == "yes":
-                limit_price = Decimal(yes_price) / Decimal(100)  # Convert cents to 0-1
-            else:
-                limit_price = Decimal(no_price) / Decimal(100)  # Convert cents to 0-1
+            limit_price = Decimal(yes_price if side_lower == "yes" else no_price) / _CENTS_PER_DOLLAR
         
         # Initialize order simulation if needed
         self._init_order_simulation()
@@ -277,11 +226,11 @@ class KalshiMarketsNamespace(BasePlatformAPI):
             "client_order_id": simulated_order.client_order_id,
             "ticker": simulated_order.token_id,
             "side": simulated_order.side.lower(),
-            "action": action.lower(),
+            "action": action_lower,
             "count": int(simulated_order.size),
             "type": order_type,
             "yes_price": int(simulated_order.limit_price * 100) if simulated_order.limit_price else None,
-            "no_price": int((Decimal(1) - simulated_order.limit_price) * 100) if simulated_order.limit_price else None,
+            "no_price": int((_ONE - simulated_order.limit_price) * 100) if simulated_order.limit_price else None,
             "status": simulated_order.status.value,
             "filled_count": int(simulated_order.filled_size),
             "fill_price": int(simulated_order.fill_price * 100) if simulated_order.fill_price else None,
@@ -2,9 +2,11 @@
 
 from typing import TYPE_CHECKING, Union
 
+from ..base_api import resolve_rate_limiter
 from .markets import KalshiMarketsNamespace
 from .orderbooks import KalshiOrderbooksNamespace
 from .trades import KalshiTradesNamespace
+from ...simulation.orders import to_decimal
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -23,6 +25,8 @@ class KalshiNamespace:
         portfolio: "Portfolio",
         rate_limiter: Union["RateLimiter", float, None] = None
     ):
+        # One limiter for all Kalshi endpoints, so they see the true request rate
+        rate_limiter = resolve_rate_limiter(rate_limiter)
         self.markets = KalshiMarketsNamespace(real_client, clock, portfolio, rate_limiter)
         self.orderbooks = KalshiOrderbooksNamespace(real_client, clock, portfolio, rate_limiter)
         self.trades = KalshiTradesNamespace(real_client, clock, portfolio, rate_limiter)
@@ -31,16 +35,19 @@ class KalshiNamespace:
         self._portfolio = portfolio
         self._clock = clock
     
+    async def close(self):
+        """Release pooled HTTP connections held by the Kalshi namespaces."""
+        await self.trades.close()
+    
     def buy(self, ticker: str, quantity, price, side: str = "YES"):
         """Convenience method to buy Kalshi contracts directly."""
-        from decimal import Decimal
         # For Kalshi, use composite key with side
         position_key = f"{ticker}:{side.upper()}"
         self._portfolio.buy(
             platform="kalshi",
             token_id=position_key,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(price)),
+            quantity=to_decimal(quantity),
+            price=to_decimal(price),
             timestamp=self._clock.current_time,
             order_type="taker",  # Default to taker
             market_type="global"  # Not applicable for Kalshi
@@ -48,14 +55,13 @@ class KalshiNamespace:
     
     def sell(self, ticker: str, quantity, price, side: str = "YES"):
         """Convenience method to sell Kalshi contracts directly."""
-        from decimal import Decimal
         # For Kalshi, use composite key with side
         position_key = f"{ticker}:{side.upper()}"
         self._portfolio.sell(
             platform="kalshi",
             token_id=position_key,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(price)),
+            quantity=to_decimal(quantity),
+            price=to_decimal(price),
             timestamp=self._clock.current_time,
             order_type="taker",  # Default to taker
             market_type="global"  # Not applicable for Kalshi
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
+from ..filters import filter_at_or_before, replace_records
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -11,6 +12,16 @@ if TYPE_CHECKING:
     from ..rate_limiter import RateLimiter
 
 
+class _OrderbooksResponse:
+    """Fallback orderbooks response when the SDK response can't be copied."""
+    
+    __slots__ = ('snapshots', 'pagination')
+    
+    def __init__(self, snapshots, pagination=None):
+        self.snapshots = snapshots
+        self.pagination = pagination
+
+
 class KalshiOrderbooksNamespace(BasePlatformAPI):
     """dome.kalshi.orderbooks.* namespace - matches Dome's structure exactly."""
     
@@ -42,47 +53,28 @@ class KalshiOrderbooksNamespace(BasePlatformAPI):
         if 'ticker' not in params:
             raise ValueError("ticker is required for get_orderbooks")
         
-        # Cap end_time at backtest time (Kalshi orderbooks use milliseconds)
-        self._cap_time_at_backtest(params, 'end_time', is_milliseconds=True)
-        
-        # Cap start_time if provided
-        if 'start_time' in params:
-            self._cap_time_at_backtest(params, 'start_time', is_milliseconds=True)
+        # Cap end_time and start_time at backtest time (Kalshi orderbooks use milliseconds)
+        self._cap_time_range(params, is_milliseconds=True)
         
-        response = await self._call_api(self._real_api.orderbooks.get_orderbooks, params)
+        # A bounded window is fixed once it is in the past; the latest snapshot never is
+        if 'end_time' in params:
+            response = await self._call_api_cached(
+                self._real_api.orderbooks.get_orderbooks, params, params['end_time'] // 1000
+            )
+        else:
+            response = await self._call_api_shared(self._real_api.orderbooks.get_orderbooks, params)
         
         # CRITICAL: Filter response data to remove orderbook snapshots after backtest time
-        # Kalshi orderbooks use 'timestamp' field (in milliseconds)
+        # Kalshi orderbooks use 'timestamp' field (in milliseconds), oldest first
         if hasattr(response, 'snapshots') and response.snapshots:
             at_time_ms = self._clock.current_time * 1000  # Convert to milliseconds
-            filtered_snapshots = []
-            for snapshot in response.snapshots:
-                # Get timestamp from snapshot (field name: timestamp, in milliseconds)
-                snapshot_timestamp = None
-                if hasattr(snapshot, 'timestamp'):
-                    snapshot_timestamp = snapshot.timestamp
-                elif isinstance(snapshot, dict):
-                    snapshot_timestamp = snapshot.get('timestamp')
-                
-                # Only include snapshots that occurred at or before backtest time
-                if snapshot_timestamp is not None and snapshot_timestamp <= at_time_ms:
-                    filtered_snapshots.append(snapshot)
+            filtered_snapshots = filter_at_or_before(response.snapshots, 'timestamp', at_time_ms, order="asc")
             
-            # Create filtered response
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.snapshots = filtered_snapshots
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, snapshots, pagination=None):
-                        self.snapshots = snapshots
-                        self.pagination = pagination
-                pagination = getattr(response, 'pagination', None)
-                return FilteredResponse(filtered_snapshots, pagination)
+            # Copy rather than mutate - the response may be shared through the cache
+            filtered_response = replace_records(response, 'snapshots', filtered_snapshots)
+            if filtered_response is not None:
+                return filtered_response
+            return _OrderbooksResponse(filtered_snapshots, getattr(response, 'pagination', None))
         
         return response
 
@@ -1,8 +1,17 @@
 """Kalshi trades namespace: dome.kalshi.trades.*"""
 
+import os
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
+from ..cache import LRUCache, params_key
+from ..filters import filter_at_or_before
+
+try:
+    import orjson as _json
+except ImportError:
+    # orjson not installed, fall back to the stdlib decoder
+    import json as _json
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -10,6 +19,23 @@ if TYPE_CHECKING:
     from ...simulation.portfolio import Portfolio
     from ..rate_limiter import RateLimiter
 
+_TRADES_URL = "https://api.domeapi.io/v1/kalshi/trades"
+
+# Keep idle pooled connections open across quiet stretches of a backtest (e.g.
+# rate-limit waits), instead of the clients' 5-15s defaults, so later requests
+# skip a new TLS handshake
+_KEEPALIVE_SECONDS = 60
+
+
+class _TradesResponse:
+    """Object-like trades response, for direct-HTTP results and filtered results."""
+    
+    __slots__ = ('trades', 'pagination')
+    
+    def __init__(self, trades, pagination=None):
+        self.trades = trades
+        self.pagination = pagination
+
 
 class KalshiTradesNamespace(BasePlatformAPI):
     """dome.kalshi.trades.* namespace - matches Dome's structure exactly."""
@@ -26,6 +52,134 @@ class KalshiTradesNamespace(BasePlatformAPI):
         # Check if trades namespace exists (may not be in SDK yet)
         # If not, we'll need to call the API directly via HTTP
         self._trades_available = hasattr(self._real_api, 'trades')
+        # Pooled HTTP session for the direct-HTTP fallback (created on first use)
+        self._session = None
+        
+        # Auth for the direct-HTTP fallback, resolved once rather than per call
+        self._api_key = (
+            os.environ.get('DOME_API_KEY')
+            or getattr(real_client, '_api_key', None)
+            or getattr(real_client, 'api_key', None)
+        )
+        self._auth_headers = {"Authorization": f"Bearer {self._api_key}"} if self._api_key else None
+        
+        # Opt-in HTTP/2 client for the direct-HTTP fallback (requires httpx[http2])
+        self._use_http2 = os.environ.get('DOME_USE_HTTP2', '').lower() in ('1', 'true', 'yes')
+        self._http2_client = None
+        
+        # ETag and decoded body per request, for conditional GETs
+        self._etag_cache = LRUCache(maxsize=256)
+
+    async def _get_session(self):
+        """Return the pooled aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=_KEEPALIVE_SECONDS,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=60, connect=10),
+            )
+        return self._session
+
+    def _get_http2_client(self):
+        """
+        Return the pooled httpx HTTP/2 client, or None if httpx/h2 aren't installed.
+        
+        HTTP/2 multiplexes concurrent requests over one connection. httpx
+        negotiates the protocol per connection, so servers without HTTP/2
+        support are transparently served over HTTP/1.1.
+        """
+        if self._http2_client is None:
+            try:
+                import httpx
+                import h2  # noqa: F401 - required by httpx for http2=True
+            except ImportError:
+                # Missing optional dependency - stay on aiohttp
+                self._use_http2 = False
+                return None
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=_KEEPALIVE_SECONDS,
+                ),
+                timeout=60,
+            )
+        return self._http2_client
+
+    async def close(self):
+        """Close the pooled HTTP clients, if any were opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+            self._http2_client = None
+
+    @staticmethod
+    def _request_failed(status: int, error_text: str, retry_after: str = None) -> ValueError:
+        """Build the error for a non-200 trades response."""
+        if status == 429 and retry_after and retry_after.isdigit() and 'retry_after' not in error_text:
+            # Surface the header in the format _call_api parses for its backoff
+            error_text = f'{error_text} {{"retry_after": {int(retry_after)}}}'
+        return ValueError(f"Request failed: {status} {error_text}")
+
+    async def _fetch_trades_direct(self, params: dict):
+        """
+        Fetch trades over HTTP while the SDK lacks the trades endpoint.
+        
+        This is a workaround until SDK is updated.
+        """
+        if not self._auth_headers:
+            raise ValueError("API key required for Kalshi trades (SDK doesn't support this endpoint yet)")
+        
+        # Revalidate previously seen responses with If-None-Match
+        key = params_key(params)
+        cached = self._etag_cache.get(key)
+        headers = self._auth_headers
+        if cached is not None:
+            headers = {**headers, 'If-None-Match': cached[0]}
+        
+        client = self._get_http2_client() if self._use_http2 else None
+        if client is not None:
+            resp = await client.get(_TRADES_URL, headers=headers, params=params)
+            status, resp_headers = resp.status_code, resp.headers
+            if status == 200:
+                response_data = _json.loads(resp.content)
+            elif not (status == 304 and cached is not None):
+                raise self._request_failed(status, resp.text, resp_headers.get('Retry-After'))
+        else:
+            # Reuse one pooled session so repeated calls skip TCP/TLS setup
+            session = await self._get_session()
+            async with session.get(_TRADES_URL, headers=headers, params=params) as resp:
+                status, resp_headers = resp.status, resp.headers
+                if status == 200:
+                    response_data = _json.loads(await resp.read())
+                elif not (status == 304 and cached is not None):
+                    error_text = await resp.text()
+                    raise self._request_failed(status, error_text, resp_headers.get('Retry-After'))
+        
+        if hasattr(self._rate_limiter, 'update_from_headers'):
+            # Slow down before the server starts rejecting requests
+            self._rate_limiter.update_from_headers(resp_headers)
+        
+        if status == 304:
+            # Not modified - reuse the body we already decoded
+            response_data = cached[1]
+        elif resp_headers.get('ETag'):
+            self._etag_cache.put(key, (resp_headers['ETag'], response_data))
+        
+        # Convert to object-like response for consistency
+        return _TradesResponse(
+            response_data.get('trades', []),
+            response_data.get('pagination', {}),
+        )
 
     async def get_trades(self, params: dict = None) -> dict:
         """
@@ -46,82 +200,33 @@ class KalshiTradesNamespace(BasePlatformAPI):
         params = params or {}
         at_time = self._clock.current_time
         
-        # Cap end_time at backtest time (Kalshi trades use seconds)
-        if 'end_time' in params:
-            params['end_time'] = min(params['end_time'], at_time)
-        else:
-            params['end_time'] = at_time
+        # Cap end_time and start_time at backtest time (Kalshi trades use seconds)
+        self._cap_time_range(params, default_end=True)
         
-        # Cap start_time if provided
-        if 'start_time' in params:
-            params['start_time'] = min(params['start_time'], at_time)
-        
-        # Check if trades namespace exists in SDK
+        # Identical concurrent requests share one rate-limited call
         if not self._trades_available:
             # SDK doesn't have trades yet - call API directly
-            # This is a workaround until SDK is updated
-            import aiohttp
-            import os
-            
-            api_key = os.environ.get('DOME_API_KEY', '')
-            if not api_key:
-                # Try to get from real_client if possible
-                if hasattr(self._real_client, '_api_key'):
-                    api_key = self._real_client._api_key
-                elif hasattr(self._real_client, 'api_key'):
-                    api_key = self._real_client.api_key
-                else:
-                    raise ValueError("API key required for Kalshi trades (SDK doesn't support this endpoint yet)")
-            
-            url = "https://api.domeapi.io/v1/kalshi/trades"
-            headers = {"Authorization": f"Bearer {api_key}"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        raise ValueError(f"Request failed: {resp.status} {error_text}")
-                    response_data = await resp.json()
-                    # Convert to object-like response for consistency
-                    class Response:
-                        def __init__(self, data):
-                            self.trades = data.get('trades', [])
-                            self.pagination = data.get('pagination', {})
-                    response = Response(response_data)
+            response = await self._call_api_shared(self._fetch_trades_direct, params)
         else:
-            response = await self._call_api(self._real_api.trades.get_trades, params)
+            response = await self._call_api_shared(self._real_api.trades.get_trades, params)
         
         # CRITICAL: Filter response data to remove trades after backtest time
-        # Kalshi trades use 'created_time' field (in seconds)
+        # Kalshi trades use 'created_time' field (in seconds), newest first
         if hasattr(response, 'trades') and response.trades:
-            filtered_trades = []
-            for trade in response.trades:
-                # Get timestamp from trade (field name: created_time, in seconds)
-                trade_timestamp = None
-                if hasattr(trade, 'created_time'):
-                    trade_timestamp = trade.created_time
-                elif isinstance(trade, dict):
-                    trade_timestamp = trade.get('created_time')
-                
-                # Only include trades that occurred at or before backtest time
-                if trade_timestamp is not None and trade_timestamp <= at_time:
-                    filtered_trades.append(trade)
+            filtered_trades = filter_at_or_before(response.trades, 'created_time', at_time, order="desc")
+            
+            # API honored the capped end_time - nothing to strip
+            if len(filtered_trades) == len(response.trades):
+                return response
             
-            # Create filtered response
+            # Nothing else holds the unfiltered list, so update the response in place
             try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.trades = filtered_trades
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, trades, pagination=None):
-                        self.trades = trades
-                        self.pagination = pagination
-                pagination = getattr(response, 'pagination', None)
-                return FilteredResponse(filtered_trades, pagination)
+                response.trades = filtered_trades
+                return response
+            except (AttributeError, TypeError, ValueError):
+                # Frozen/slotted SDK response, or a pydantic model whose ValidationError
+                # (a ValueError) rejects the assignment - rebuild it instead
+                return _TradesResponse(filtered_trades, getattr(response, 'pagination', None))
         
         return response
 
@@ -1,8 +1,21 @@
 """Matching markets namespace: dome.matching_markets.*"""
 
-from typing import TYPE_CHECKING, Union
+import asyncio
+import os
+import re
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional, Union
 
-from ..base_api import BasePlatformAPI
+from ..base_api import (
+    BasePlatformAPI,
+    backoff_delay,
+    invoke_sdk_method,
+    is_rate_limit_error,
+    is_transient_error,
+    parse_retry_after,
+    resolve_rate_limiter,
+)
+from ..cache import LRUCache, PersistentCache, params_key
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -10,6 +23,52 @@ if TYPE_CHECKING:
     from ...simulation.portfolio import Portfolio
     from ..rate_limiter import RateLimiter
 
+# Lookup params of get_matching_markets; exactly one must be given
+_MM_KEYS = frozenset(('polymarket_market_slug', 'kalshi_event_ticker'))
+
+_SPORTS = ('nfl', 'mlb', 'cfb', 'nba', 'nhl', 'cbb')
+_VALID_SPORTS = frozenset(_SPORTS)
+_VALID_SPORTS_STR = ', '.join(_SPORTS)
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# How long persisted responses stay valid (seconds): cross-platform matches can
+# still be added for a slug; sport listings for a past date are final
+_MATCHING_MARKETS_TTL = 24 * 3600
+_SPORT_TODAY_TTL = 300
+
+# Most slugs/tickers merged into one batched get_matching_markets call
+_MAX_BATCH_KEYS = 20
+
+
+def _existed(market, at_time: int) -> bool:
+    """Check if a matching market existed at backtest time."""
+    # Markets may have start_time field, or we can infer from platform
+    start_time = getattr(market, 'start_time', None)
+    if start_time:
+        return start_time <= at_time
+    if isinstance(market, dict) and 'start_time' in market:
+        return market['start_time'] <= at_time
+    # If no start_time available, we can't definitively check, so include it
+    # (better to include than exclude if uncertain to avoid false negatives)
+    return True
+
+
+def _fail_lookups(lookups, error: Exception):
+    """Set `error` on every queued (values, future) lookup not already resolved."""
+    for _, future in lookups:
+        if not future.done():
+            future.set_exception(error)
+
+
+class _FilteredResponse:
+    """Markets response built locally (batched lookups, filtered results)."""
+    
+    __slots__ = ('markets',)
+    
+    def __init__(self, markets):
+        self.markets = markets
+
 
 class MatchingMarketsNamespace:
     """dome.matching_markets.* namespace - matches Dome's structure exactly."""
@@ -19,22 +78,39 @@ class MatchingMarketsNamespace:
         real_client: "DomeClient",
         clock: "SimulationClock",
         portfolio: "Portfolio",
-        rate_limiter: Union["RateLimiter", float, None] = None
+        rate_limiter: Union["RateLimiter", float, None] = None,
+        disk_cache: Optional[PersistentCache] = None,
     ):
         self._real_client = real_client
         self._clock = clock
         self._portfolio = portfolio
         
         # Handle rate limiter: accept RateLimiter, float (backward compat), or None (default to free tier)
-        if rate_limiter is None:
-            from ..rate_limiter import RateLimiter
-            self._rate_limiter = RateLimiter(tier="free")
-        elif isinstance(rate_limiter, float):
-            # Backward compatibility: convert old float rate_limit to free tier
-            from ..rate_limiter import RateLimiter
-            self._rate_limiter = RateLimiter(tier="free")
-        else:
-            self._rate_limiter = rate_limiter
+        self._rate_limiter = resolve_rate_limiter(rate_limiter)
+        
+        # Raw API responses by endpoint and params. Matching-market lookups take no
+        # time parameters (filtering to backtest time happens afterwards), so a
+        # repeated lookup on a later tick can reuse the earlier response.
+        self._response_cache = LRUCache(maxsize=512)
+        
+        # Optional on-disk cache shared across runs: the client passes its own in,
+        # otherwise one is opened when DOME_CACHE_DIR is set
+        if disk_cache is None:
+            cache_dir = os.environ.get('DOME_CACHE_DIR')
+            if cache_dir:
+                disk_cache = PersistentCache(os.path.join(cache_dir, 'matching_markets.sqlite'))
+        self._disk_cache = disk_cache
+        
+        # Uncached requests in flight, so concurrent identical calls share one
+        self._inflight = {}
+        
+        # Lookups waiting to be merged into one call: field -> [(values, future)]
+        self._pending_lookups = {}
+    
+    async def close(self):
+        """Close the on-disk cache's database connection (it reopens on next use)."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     async def get_matching_markets(self, params: dict) -> dict:
         """
@@ -51,59 +127,37 @@ class MatchingMarketsNamespace:
         
         Returns: Markets object with matching markets across platforms (Polymarket, Kalshi)
         """
-        if 'polymarket_market_slug' not in params and 'kalshi_event_ticker' not in params:
+        lookup_keys = params.keys() & _MM_KEYS
+        if not lookup_keys:
             raise ValueError(
                 "At least one of 'polymarket_market_slug' or 'kalshi_event_ticker' is required"
             )
         
-        if 'polymarket_market_slug' in params and 'kalshi_event_ticker' in params:
+        if len(lookup_keys) == 2:
             raise ValueError(
                 "Cannot provide both 'polymarket_market_slug' and 'kalshi_event_ticker' - provide only one"
             )
         
         # Matching markets don't have time-based filtering, but we should filter
         # results to only show markets that existed at backtest time
-        response = await self._call_api(self._real_client.matching_markets.get_matching_markets, params)
+        field = next(iter(lookup_keys))
+        if len(params) == 1:
+            # Concurrent lookups by slug/ticker are merged into one call
+            response = await self._batched_lookup(field, params[field])
+        else:
+            response = await self._cached_call(self._real_client.matching_markets.get_matching_markets, params)
         
         # Filter markets to only include those that existed at backtest time
         if hasattr(response, 'markets') and response.markets:
             at_time = self._clock.current_time
-            filtered_markets = {}
+            filtered_markets = {
+                key: kept
+                for key, market_list in response.markets.items()
+                if (kept := [market for market in market_list if _existed(market, at_time)])
+            }
             
-            for key, market_list in response.markets.items():
-                filtered_list = []
-                for market in market_list:
-                    # Check if market existed at backtest time
-                    # Markets may have start_time field, or we can infer from platform
-                    market_existed = True
-                    
-                    # Check if market has start_time field
-                    if hasattr(market, 'start_time') and market.start_time:
-                        market_existed = market.start_time <= at_time
-                    elif isinstance(market, dict) and 'start_time' in market:
-                        market_existed = market['start_time'] <= at_time
-                    # If no start_time available, we can't definitively check, so include it
-                    # (better to include than exclude if uncertain to avoid false negatives)
-                    
-                    if market_existed:
-                        filtered_list.append(market)
-                
-                if filtered_list:
-                    filtered_markets[key] = filtered_list
-            
-            # Create filtered response
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.markets = filtered_markets
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, markets):
-                        self.markets = markets
-                return FilteredResponse(filtered_markets)
+            # Create filtered response (the API response carries only `markets`)
+            return _FilteredResponse(filtered_markets)
         
         return response
 
@@ -126,86 +180,195 @@ class MatchingMarketsNamespace:
             raise ValueError("date is required for get_matching_markets_by_sport (format: YYYY-MM-DD)")
         
         sport = params.get('sport')
-        valid_sports = ['nfl', 'mlb', 'cfb', 'nba', 'nhl', 'cbb']
-        if sport not in valid_sports:
-            raise ValueError(f"sport must be one of: {', '.join(valid_sports)}. Got: {sport}")
+        if sport not in _VALID_SPORTS:
+            raise ValueError(f"sport must be one of: {_VALID_SPORTS_STR}. Got: {sport}")
         
         # Validate date format
-        import re
         date = params.get('date')
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+        if not _DATE_RE.match(date):
             raise ValueError(f"date must be in YYYY-MM-DD format. Got: {date}")
         
         # Filter markets to only include those that existed at backtest time
-        response = await self._call_api(
+        # Listings for past dates never change; today's may still gain games
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        response = await self._cached_call(
             self._real_client.matching_markets.get_matching_markets_by_sport,
-            params
+            params,
+            ttl=None if date < today else _SPORT_TODAY_TTL,
         )
         
         # Similar filtering as get_matching_markets
         if hasattr(response, 'markets') and response.markets:
             at_time = self._clock.current_time
-            filtered_markets = {}
+            filtered_markets = {
+                key: kept
+                for key, market_list in response.markets.items()
+                if (kept := [market for market in market_list if _existed(market, at_time)])
+            }
             
-            for key, market_list in response.markets.items():
-                filtered_list = []
-                for market in market_list:
-                    # Check if market existed at backtest time
-                    market_existed = True
-                    
-                    # Check if market has start_time field
-                    if hasattr(market, 'start_time') and market.start_time:
-                        market_existed = market.start_time <= at_time
-                    elif isinstance(market, dict) and 'start_time' in market:
-                        market_existed = market['start_time'] <= at_time
-                    # If no start_time available, include it (better safe than sorry)
-                    
-                    if market_existed:
-                        filtered_list.append(market)
+            return _FilteredResponse(filtered_markets)
+        
+        return response
+
+    async def _batched_lookup(self, field: str, values):
+        """
+        Look up matching markets for `values`, merged with concurrent lookups.
+        
+        Requests made in the same event-loop turn (e.g. a strategy gathering
+        lookups for many slugs) are sent as a single get_matching_markets
+        call with all their keys; each caller gets back only its own keys.
+        A lone request is sent unchanged, without added delay.
+        """
+        # Checked before queuing: a bad value would otherwise fail inside the
+        # flush callback and leave every queued caller waiting
+        if not (
+            isinstance(values, str)
+            or (isinstance(values, (list, tuple)) and all(isinstance(value, str) for value in values))
+        ):
+            raise ValueError(f"{field} must be a string or a list of strings. Got: {values!r}")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending_lookups.setdefault(field, [])
+        if not pending:
+            # Runs after the other coroutines scheduled in this turn have queued
+            loop.call_soon(self._flush_lookups, field)
+        pending.append((values, future))
+        return await future
+
+    def _flush_lookups(self, field: str):
+        """Group the queued lookups for `field` into calls of at most _MAX_BATCH_KEYS keys."""
+        pending = self._pending_lookups.pop(field, [])
+        try:
+            batch, batch_keys = [], set()
+            for values, future in pending:
+                keys = {values} if isinstance(values, str) else set(values)
+                if batch and len(batch_keys | keys) > _MAX_BATCH_KEYS:
+                    asyncio.ensure_future(self._dispatch_lookups(field, batch, batch_keys))
+                    batch, batch_keys = [], set()
+                batch.append((values, future))
+                batch_keys |= keys
+            if batch:
+                asyncio.ensure_future(self._dispatch_lookups(field, batch, batch_keys))
+        except Exception as e:
+            # Nothing awaits this callback - hand the error to the callers instead
+            _fail_lookups(pending, e)
+
+    async def _dispatch_lookups(self, field: str, batch: list, batch_keys: set):
+        """
+        Make one get_matching_markets call for a batch and hand each caller its keys.
+        
+        If the merged call fails (e.g. one invalid slug rejects the whole
+        request) or its response lacks some of a caller's keys, that caller
+        falls back to its own lookup, as if it had not been batched.
+        """
+        callers = batch
+        try:
+            method = self._real_client.matching_markets.get_matching_markets
+            if len(batch) > 1:
+                try:
+                    response = await self._cached_call(method, {field: sorted(batch_keys)})
+                except Exception:
+                    response = None
                 
-                if filtered_list:
-                    filtered_markets[key] = filtered_list
+                unresolved = []
+                if response is not None:
+                    markets = getattr(response, 'markets', None) or {}
+                    for values, future in batch:
+                        if future.done():
+                            continue
+                        keys = (values,) if isinstance(values, str) else values
+                        if all(key in markets for key in keys):
+                            future.set_result(_FilteredResponse({key: markets[key] for key in keys}))
+                        else:
+                            unresolved.append((values, future))
+                    batch = unresolved
             
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.markets = filtered_markets
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, markets):
-                        self.markets = markets
-                return FilteredResponse(filtered_markets)
+            # Lone or unresolved lookups keep the caller's params and SDK response as-is
+            await asyncio.gather(*(
+                self._resolve_lookup(method, field, values, future) for values, future in batch
+            ))
+        except Exception as e:
+            # Runs as a detached task - make sure no caller is left waiting
+            _fail_lookups(callers, e)
+
+    async def _resolve_lookup(self, method, field: str, values, future):
+        """Fulfil one caller's lookup with its own get_matching_markets call."""
+        if future.done():
+            return
+        try:
+            response = await self._cached_call(method, {field: values})
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(response)
+
+    async def _cached_call(self, method, params: dict, ttl: float = _MATCHING_MARKETS_TTL):
+        """
+        Call API method via _call_api, reusing the response for repeated params.
         
+        Responses are kept in memory for this run and, when DOME_CACHE_DIR is
+        set, on disk for `ttl` seconds (None = forever) across runs.
+        """
+        key = (getattr(method, '__name__', repr(method)), params_key(params))
+        response = self._response_cache.get(key)
+        if response is not None:
+            return response
+        
+        # Concurrent misses for the same key share one fetch
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_uncached(method, params, key, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_uncached(self, method, params: dict, key: tuple, ttl: float):
+        """Load a response from the disk cache or the API, and remember it."""
+        response = None
+        if self._disk_cache is not None:
+            response = self._disk_cache.get(repr(key))
+        if response is None:
+            response = await self._call_api(method, params)
+            if self._disk_cache is not None:
+                self._disk_cache.put(repr(key), response, ttl)
+        
+        self._response_cache.put(key, response)
         return response
 
     async def _call_api(self, method, params: dict, max_retries: int = 3):
         """Call API method with rate limiting (shared with BasePlatformAPI logic)."""
-        import asyncio
-        import inspect
-        
         for attempt in range(max_retries):
             # Rate limiting: wait until we can make a request
             await self._rate_limiter.acquire()
             
             try:
-                result = method(params)
-                if inspect.iscoroutine(result):
-                    result = await result
-                return result
+                return await invoke_sdk_method(method, params)
             except ValueError as e:
                 error_str = str(e)
-                if "429" in error_str or "Rate Limit" in error_str or "rate limit" in error_str.lower():
+                if is_rate_limit_error(error_str):
                     if attempt < max_retries - 1:
-                        retry_after = 10
-                        wait_time = retry_after + (attempt * 2)
-                        print(f"[INFO] Rate limit hit, waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        await asyncio.sleep(wait_time)
+                        # Honor the server's retry_after when the error carries one
+                        retry_after = parse_retry_after(error_str, default=10)
+                        wait_time = backoff_delay(retry_after, attempt)
+                        print(f"[INFO] Rate limit hit, waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                        if hasattr(self._rate_limiter, 'pause'):
+                            # Pause the shared limiter; the next acquire() waits it out
+                            self._rate_limiter.pause(wait_time)
+                        else:
+                            await asyncio.sleep(wait_time)
                         continue
                     else:
                         raise ValueError(f"Rate limit exceeded after {max_retries} retries. {error_str}")
+                elif is_transient_error(error_str) and attempt < max_retries - 1:
+                    wait_time = backoff_delay(0, attempt)
+                    print(f"[INFO] Server error, waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                    await asyncio.sleep(wait_time)
+                    continue
                 else:
                     raise
 
@@ -71,6 +71,12 @@ class HistoricalMarket:
             historical_status=historical_status,
             was_resolved=was_resolved,
         )
+    
+    @classmethod
+    def from_markets(cls, markets, at_time: int) -> list:
+        """Convert a list of API Markets with from_market, in order."""
+        from_market = cls.from_market
+        return [from_market(market, at_time) for market in markets]
 
 
 @dataclass
@@ -131,6 +137,12 @@ class HistoricalKalshiMarket:
             was_resolved=was_resolved,
             historical_result=historical_result,
         )
+    
+    @classmethod
+    def from_markets(cls, markets, at_time: int) -> list:
+        """Convert a list of API KalshiMarketData with from_market, in order."""
+        from_market = cls.from_market
+        return [from_market(market, at_time) for market in markets]
 
 
 @dataclass
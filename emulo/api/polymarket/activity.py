@@ -1,5 +1,6 @@
 """Polymarket activity namespace: dome.polymarket.activity.*"""
 
+import copy
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
@@ -48,15 +49,8 @@ class PolymarketActivityNamespace(BasePlatformAPI):
         
         at_time = self._clock.current_time
         
-        # Cap end_time at backtest time (activity uses seconds)
-        if 'end_time' in params:
-            params['end_time'] = min(params['end_time'], at_time)
-        else:
-            params['end_time'] = at_time
-        
-        # Cap start_time if provided
-        if 'start_time' in params:
-            params['start_time'] = min(params['start_time'], at_time)
+        # Cap end_time and start_time at backtest time (activity uses seconds)
+        self._cap_time_range(params, default_end=True)
         
         response = await self._call_api(self._real_api.activity.get_activity, params)
         
@@ -78,12 +72,11 @@ class PolymarketActivityNamespace(BasePlatformAPI):
             
             # Create filtered response
             try:
-                import copy
                 if hasattr(response, '__dict__'):
                     filtered_response = copy.copy(response)
                     filtered_response.activities = filtered_activities
                     return filtered_response
-            except (AttributeError, TypeError):
+            except (AttributeError, TypeError, ValueError):
                 # Fallback if copy fails - create simple response object
                 class FilteredResponse:
                     def __init__(self, activities, pagination=None):
@@ -1,10 +1,13 @@
 """Polymarket markets namespace: dome.polymarket.markets.*"""
 
 from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
+from ..filters import filter_at_or_before, get_timestamp, replace_records
 from ..models import HistoricalMarket, HistoricalMarketsResponse
+from ...simulation.orders import OrderStatus, normalize_side
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -13,6 +16,84 @@ if TYPE_CHECKING:
     from ..rate_limiter import RateLimiter
 
 
+_DAY = 24 * 3600
+
+# Candlestick interval (minutes) -> (max range in seconds, interval label,
+# max range label, unit and unit name for the requested range in the error)
+_INTERVAL_LIMITS = {
+    1: (7 * _DAY, "1m", "1 week", _DAY, "days"),
+    60: (30 * _DAY, "1h", "1 month", _DAY, "days"),
+    1440: (365 * _DAY, "1d", "1 year", 365 * _DAY, "years"),
+}
+
+# Simulated order status -> Dome API order status
+_DOME_ORDER_STATUS = {
+    OrderStatus.MATCHED: "matched",
+    OrderStatus.FILLED: "matched",  # Dome API reports fills as matched
+    OrderStatus.PARTIALLY_FILLED: "partially_filled",
+    OrderStatus.PENDING: "pending",
+    OrderStatus.REJECTED: "rejected",
+    OrderStatus.CANCELLED: "cancelled",
+    OrderStatus.EXPIRED: "expired",
+}
+
+# C-level attribute readers for the per-market dedupe key
+_get_condition_id = attrgetter('condition_id')
+_get_market_slug = attrgetter('market_slug')
+
+
+def _market_id(market):
+    """Dedupe key for a Polymarket market."""
+    try:
+        return _get_condition_id(market) or _get_market_slug(market)
+    except AttributeError:
+        return getattr(market, 'condition_id', None) or getattr(market, 'market_slug', None)
+
+
+def _filter_candlesticks(candlesticks: list, at_time: int) -> list:
+    """
+    Keep the (candlestick, metadata) pairs whose end_period_ts is at or before at_time.
+    
+    Responses are homogeneous, so the record shape is read from the first
+    pair and the whole list is filtered with a comprehension specialized to
+    it. Anything unexpected (malformed pairs, missing timestamps) falls back
+    to the generic per-item check.
+    """
+    first = candlesticks[0]
+    try:
+        if isinstance(first[0], dict):
+            return [pair for pair in candlesticks if len(pair) >= 2 and pair[0]['end_period_ts'] <= at_time]
+        return [pair for pair in candlesticks if len(pair) >= 2 and pair[0].end_period_ts <= at_time]
+    except (AttributeError, IndexError, KeyError, TypeError):
+        pass
+    
+    return [
+        pair for pair in candlesticks
+        if isinstance(pair, (list, tuple)) and len(pair) >= 2
+        and (end_period := get_timestamp(pair[0], 'end_period_ts')) is not None
+        and end_period <= at_time
+    ]
+
+
+class _CandlesticksResponse:
+    """Object-like candlesticks response, for filtered results that can't reuse the SDK type."""
+    
+    __slots__ = ('candlesticks',)
+    
+    def __init__(self, candlesticks):
+        self.candlesticks = candlesticks
+
+
+class _OrderbooksResponse:
+    """Fallback orderbooks response when the SDK response can't be copied."""
+    
+    __slots__ = ('snapshots', 'pagination_key')
+    
+    def __init__(self, snapshots, pagination_key=None):
+        self.snapshots = snapshots
+        self.pagination_key = pagination_key
+
+
 class PolymarketMarketsNamespace(BasePlatformAPI):
     """dome.polymarket.markets.* namespace - matches Dome's structure exactly."""
     
@@ -51,130 +132,10 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
         requested_status = params.pop('status', None)
         original_limit = params.get('limit', 100)
         
-        # Smart progressive time window expansion
-        time_windows = []
-        if requested_status == 'open':
-            base_window = 7 * 24 * 3600  # 7 days
-            time_windows = [
-                (at_time - base_window, at_time + base_window * 3),
-                (at_time - base_window * 2, at_time + base_window * 6),
-                (at_time - base_window * 4, at_time + base_window * 12),
-                (at_time - (90 * 24 * 3600), at_time + (180 * 24 * 3600)),
-                (at_time - (180 * 24 * 3600), at_time + (365 * 24 * 3600)),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
-        elif requested_status == 'closed':
-            base_window = 7 * 24 * 3600
-            time_windows = [
-                (at_time - base_window * 2, at_time),
-                (at_time - base_window * 4, at_time),
-                (at_time - (90 * 24 * 3600), at_time),
-                (at_time - (180 * 24 * 3600), at_time),
-                (at_time - (365 * 24 * 3600), at_time),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
-        else:
-            base_window = 7 * 24 * 3600
-            time_windows = [
-                (at_time - base_window, at_time + base_window),
-                (at_time - base_window * 2, at_time + base_window * 2),
-                (at_time - base_window * 4, at_time + base_window * 4),
-                (at_time - (90 * 24 * 3600), at_time + (90 * 24 * 3600)),
-                (at_time - (180 * 24 * 3600), at_time + (180 * 24 * 3600)),
-                (at_time - (365 * 24 * 3600), at_time + (365 * 24 * 3600)),
-            ]
-        
-        seen_market_ids = set()
-        filtered_markets = []
-        
-        for window_start, window_end in time_windows:
-            if 'start_time' in params:
-                window_start = params['start_time']
-            if 'end_time' in params:
-                window_end = params['end_time']
-            
-            api_params = params.copy()
-            api_params['start_time'] = window_start
-            api_params['end_time'] = window_end
-            
-            offset = 0
-            limit = api_params.get('limit', 100)
-            page_count = 0
-            max_pages_per_window = 20
-            consecutive_empty_pages = 0
-            markets_found_in_this_window = 0
-            
-            while page_count < max_pages_per_window:
-                api_params['offset'] = offset
-                api_params['limit'] = min(limit, 100)  # API max is 100
-                
-                response = await self._call_api(self._real_api.markets.get_markets, api_params)
-                
-                if not response.markets:
-                    break
-                
-                page_count += 1
-                new_markets_in_window = 0
-                
-                for market in response.markets:
-                    market_id = getattr(market, 'condition_id', None) or getattr(market, 'market_slug', None)
-                    if market_id and market_id in seen_market_ids:
-                        continue
-                    
-                    if not self._market_existed_at_time(market, at_time):
-                        continue
-                    
-                    if requested_status == 'open':
-                        if not self._market_was_open_at_time(market, at_time):
-                            continue
-                    elif requested_status == 'closed':
-                        if not self._market_was_closed_at_time(market, at_time):
-                            continue
-                    
-                    filtered_markets.append(market)
-                    if market_id:
-                        seen_market_ids.add(market_id)
-                    new_markets_in_window += 1
-                    markets_found_in_this_window += 1
-                
-                if original_limit and len(filtered_markets) >= original_limit:
-                    break
-                
-                if hasattr(response, 'pagination') and response.pagination:
-                    if isinstance(response.pagination, dict):
-                        has_more = response.pagination.get('has_more', False)
-                    else:
-                        has_more = getattr(response.pagination, 'has_more', False)
-                    if not has_more:
-                        break
-                    offset += len(response.markets)
-                else:
-                    if len(response.markets) < api_params['limit']:
-                        break
-                    offset += len(response.markets)
-                
-                if new_markets_in_window == 0:
-                    consecutive_empty_pages += 1
-                    if (consecutive_empty_pages >= 3 and 
-                        page_count >= 5 and 
-                        markets_found_in_this_window == 0):
-                        break
-                else:
-                    consecutive_empty_pages = 0
-            
-            if original_limit and len(filtered_markets) >= original_limit:
-                break
-            
-            if not original_limit and len(filtered_markets) >= 500:
-                break
-        
-        historical_markets = []
-        for market in filtered_markets:
-            historical_market = HistoricalMarket.from_market(market, at_time)
-            historical_markets.append(historical_market)
-        
-        if original_limit and original_limit < len(historical_markets):
-            historical_markets = historical_markets[:original_limit]
+        filtered_markets = await self._search_markets(
+            params, requested_status, at_time, original_limit, _market_id
+        )
+        historical_markets = HistoricalMarket.from_markets(filtered_markets, at_time)
         
         return HistoricalMarketsResponse(
             markets=historical_markets,
@@ -196,19 +157,19 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
         if 'token_id' not in params:
             raise ValueError("token_id is required for get_market_price")
         
-        # Set at_time to backtest time if not provided
-        params['at_time'] = params.get('at_time', self._clock.current_time)
-        
-        # Cap at_time at backtest time to prevent lookahead
-        params['at_time'] = min(params['at_time'], self._clock.current_time)
+        # Default at_time to backtest time, and cap it there to prevent lookahead
+        at_time = self._clock.current_time
+        params['at_time'] = min(params.get('at_time', at_time), at_time)
         
-        response = await self._call_api(self._real_api.markets.get_market_price, params)
+        response = await self._call_api_cached(
+            self._real_api.markets.get_market_price, params, params['at_time']
+        )
         
         # CRITICAL: Verify the returned price's at_time is not after backtest time
         # get_market_price returns a single price with an at_time field
         if hasattr(response, 'at_time'):
             response_at_time = response.at_time
-            if response_at_time > self._clock.current_time:
+            if response_at_time > at_time:
                 # This shouldn't happen if API respects at_time param, but verify
                 # The API should respect at_time, so this is just a safety check
                 pass
@@ -235,7 +196,8 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
             raise ValueError("start_time and end_time are required for get_candlesticks")
         
         # Cap end_time at backtest time (candlesticks use seconds)
-        self._cap_time_at_backtest(params, 'end_time', is_milliseconds=False)
+        at_time = self._clock.current_time
+        params['end_time'] = min(params['end_time'], at_time)
         
         interval = params.get('interval', 1)
         start_time = params['start_time']
@@ -243,61 +205,28 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
         time_range = end_time - start_time
         
         # Validate range limits per Dome docs
-        if interval == 1:  # 1 minute
-            max_range = 7 * 24 * 3600  # 1 week
-            if time_range > max_range:
-                raise ValueError(
-                    f"For 1m interval, max range is 1 week. "
-                    f"Requested range: {time_range / (24 * 3600):.2f} days"
-                )
-        elif interval == 60:  # 1 hour
-            max_range = 30 * 24 * 3600  # 1 month
-            if time_range > max_range:
-                raise ValueError(
-                    f"For 1h interval, max range is 1 month. "
-                    f"Requested range: {time_range / (24 * 3600):.2f} days"
-                )
-        elif interval == 1440:  # 1 day
-            max_range = 365 * 24 * 3600  # 1 year
-            if time_range > max_range:
-                raise ValueError(
-                    f"For 1d interval, max range is 1 year. "
-                    f"Requested range: {time_range / (365 * 24 * 3600):.2f} years"
-                )
-        
-        response = await self._call_api(self._real_api.markets.get_candlesticks, params)
+        interval_limit = _INTERVAL_LIMITS.get(interval)
+        if interval_limit is None:
+            raise ValueError(f"interval must be one of: 1, 60, 1440. Got: {interval}")
+        max_range, label, max_label, unit, unit_name = interval_limit
+        if time_range > max_range:
+            raise ValueError(
+                f"For {label} interval, max range is {max_label}. "
+                f"Requested range: {time_range / unit:.2f} {unit_name}"
+            )
+        
+        response = await self._call_api_cached(
+            self._real_api.markets.get_candlesticks, params, params['end_time']
+        )
         
         # Filter candlesticks to only include those up to backtest time
         if hasattr(response, 'candlesticks') and response.candlesticks:
-            filtered_candlesticks = []
-            at_time = self._clock.current_time
+            filtered_candlesticks = _filter_candlesticks(response.candlesticks, at_time)
             
-            for candlestick_tuple in response.candlesticks:
-                if not isinstance(candlestick_tuple, (list, tuple)) or len(candlestick_tuple) < 2:
-                    continue
-                
-                candlestick_data = candlestick_tuple[0]
-                end_period = None
-                if hasattr(candlestick_data, 'end_period_ts'):
-                    end_period = candlestick_data.end_period_ts
-                elif isinstance(candlestick_data, dict):
-                    end_period = candlestick_data.get('end_period_ts')
-                
-                if end_period is not None and end_period <= at_time:
-                    filtered_candlesticks.append(candlestick_tuple)
-            
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.candlesticks = filtered_candlesticks
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, candlesticks):
-                        self.candlesticks = candlesticks
-                return FilteredResponse(filtered_candlesticks)
+            filtered_response = replace_records(response, 'candlesticks', filtered_candlesticks)
+            if filtered_response is not None:
+                return filtered_response
+            return _CandlesticksResponse(filtered_candlesticks)
         
         return response
 
@@ -320,47 +249,28 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
         if 'token_id' not in params:
             raise ValueError("token_id is required for get_orderbooks")
         
-        # Cap end_time at backtest time (orderbooks use milliseconds)
-        self._cap_time_at_backtest(params, 'end_time', is_milliseconds=True)
-        
-        # Cap start_time if provided
-        if 'start_time' in params:
-            self._cap_time_at_backtest(params, 'start_time', is_milliseconds=True)
+        # Cap end_time and start_time at backtest time (orderbooks use milliseconds)
+        self._cap_time_range(params, is_milliseconds=True)
         
-        response = await self._call_api(self._real_api.markets.get_orderbooks, params)
+        # A bounded window is fixed once it is in the past; the latest snapshot never is
+        if 'end_time' in params:
+            response = await self._call_api_cached(
+                self._real_api.markets.get_orderbooks, params, params['end_time'] // 1000
+            )
+        else:
+            response = await self._call_api_shared(self._real_api.markets.get_orderbooks, params)
         
         # CRITICAL: Filter response data to remove orderbook snapshots after backtest time
-        # Orderbooks use 'timestamp' field (in milliseconds)
+        # Orderbooks use 'timestamp' field (in milliseconds), oldest first
         if hasattr(response, 'snapshots') and response.snapshots:
             at_time_ms = self._clock.current_time * 1000  # Convert to milliseconds
-            filtered_snapshots = []
-            for snapshot in response.snapshots:
-                # Get timestamp from snapshot (field name: timestamp, in milliseconds)
-                snapshot_timestamp = None
-                if hasattr(snapshot, 'timestamp'):
-                    snapshot_timestamp = snapshot.timestamp
-                elif isinstance(snapshot, dict):
-                    snapshot_timestamp = snapshot.get('timestamp')
-                
-                # Only include snapshots that occurred at or before backtest time
-                if snapshot_timestamp is not None and snapshot_timestamp <= at_time_ms:
-                    filtered_snapshots.append(snapshot)
+            filtered_snapshots = filter_at_or_before(response.snapshots, 'timestamp', at_time_ms, order="asc")
             
-            # Create filtered response
-            try:
-                import copy
-                if hasattr(response, '__dict__'):
-                    filtered_response = copy.copy(response)
-                    filtered_response.snapshots = filtered_snapshots
-                    return filtered_response
-            except (AttributeError, TypeError):
-                # Fallback if copy fails - create simple response object
-                class FilteredResponse:
-                    def __init__(self, snapshots, pagination_key=None):
-                        self.snapshots = snapshots
-                        self.pagination_key = pagination_key
-                pagination_key = getattr(response, 'pagination_key', None)
-                return FilteredResponse(filtered_snapshots, pagination_key)
+            # Copy rather than mutate - the response may be shared through the cache
+            filtered_response = replace_records(response, 'snapshots', filtered_snapshots)
+            if filtered_response is not None:
+                return filtered_response
+            return _OrderbooksResponse(filtered_snapshots, getattr(response, 'pagination_key', None))
         
         return response
 
@@ -415,7 +325,6 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
             raise ValueError(f"side must be 'buy' or 'sell', got: {side}")
         
         # Normalize side to internal format
-        from ...simulation.orders import normalize_side
         normalized_side = normalize_side(side)
         
         # Validate order_type (Dome API format - no MARKET, use FOK instead)
@@ -456,20 +365,7 @@ class PolymarketMarketsNamespace(BasePlatformAPI):
         )
         
         # Map status to Dome API format
-        from ...simulation.orders import OrderStatus
-        status = simulated_order.status.value
-        if simulated_order.status in [OrderStatus.MATCHED, OrderStatus.FILLED]:
-            status = "matched"  # Dome API format
-        elif simulated_order.status == OrderStatus.PARTIALLY_FILLED:
-            status = "partially_filled"  # Partial fill status
-        elif simulated_order.status == OrderStatus.PENDING:
-            status = "pending"
-        elif simulated_order.status == OrderStatus.REJECTED:
-            status = "rejected"
-        elif simulated_order.status == OrderStatus.CANCELLED:
-            status = "cancelled"
-        elif simulated_order.status == OrderStatus.EXPIRED:
-            status = "expired"
+        status = _DOME_ORDER_STATUS.get(simulated_order.status, simulated_order.status.value)
         
         # Return response in Dome API format (buy/sell, matched status)
         return {
@@ -7,6 +7,7 @@ from .orders import PolymarketOrdersNamespace
 from .wallet import PolymarketWalletNamespace
 from .activity import PolymarketActivityNamespace
 from .websocket import PolymarketWebSocketNamespace
+from ...simulation.orders import to_decimal
 
 if TYPE_CHECKING:
     from dome_api_sdk import DomeClient
@@ -37,12 +38,11 @@ class PolymarketNamespace:
     
     def buy(self, token_id: str, quantity, price, order_type: str = "taker", market_type: str = "global"):
         """Convenience method to buy tokens directly."""
-        from decimal import Decimal
         self._portfolio.buy(
             platform="polymarket",
             token_id=token_id,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(price)),
+            quantity=to_decimal(quantity),
+            price=to_decimal(price),
             timestamp=self._clock.current_time,
             order_type=order_type,
             market_type=market_type
@@ -50,12 +50,11 @@ class PolymarketNamespace:
     
     def sell(self, token_id: str, quantity, price, order_type: str = "taker", market_type: str = "global"):
         """Convenience method to sell tokens directly."""
-        from decimal import Decimal
         self._portfolio.sell(
             platform="polymarket",
             token_id=token_id,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(price)),
+            quantity=to_decimal(quantity),
+            price=to_decimal(price),
             timestamp=self._clock.current_time,
             order_type=order_type,
             market_type=market_type
@@ -1,5 +1,6 @@
 """Polymarket wallet namespace: dome.polymarket.wallet.*"""
 
+import copy
 from typing import TYPE_CHECKING, Union
 
 from ..base_api import BasePlatformAPI
@@ -46,15 +47,9 @@ class PolymarketWalletNamespace(BasePlatformAPI):
             raise ValueError("Cannot provide both 'eoa' and 'proxy' - provide only one")
         
         params = params.copy()
-        at_time = self._clock.current_time
-        
-        # Cap end_time at backtest time if provided (wallet uses seconds)
-        if 'end_time' in params:
-            params['end_time'] = min(params['end_time'], at_time)
         
-        # Cap start_time if provided
-        if 'start_time' in params:
-            params['start_time'] = min(params['start_time'], at_time)
+        # Cap end_time and start_time at backtest time if provided (wallet uses seconds)
+        self._cap_time_range(params)
         
         return await self._call_api(self._real_api.wallet.get_wallet, params)
 
@@ -84,15 +79,8 @@ class PolymarketWalletNamespace(BasePlatformAPI):
         
         at_time = self._clock.current_time
         
-        # Cap end_time at backtest time (wallet_pnl uses seconds) - modify in place first
-        if 'end_time' in params:
-            params['end_time'] = min(params['end_time'], at_time)
-        else:
-            params['end_time'] = at_time
-        
-        # Cap start_time if provided
-        if 'start_time' in params:
-            params['start_time'] = min(params['start_time'], at_time)
+        # Cap end_time and start_time at backtest time (wallet_pnl uses seconds)
+        self._cap_time_range(params, default_end=True)
         
         # Now make a copy for the API call (API might modify it)
         params = params.copy()
@@ -117,7 +105,6 @@ class PolymarketWalletNamespace(BasePlatformAPI):
             
             # Create filtered response
             try:
-                import copy
                 if hasattr(response, '__dict__'):
                     filtered_response = copy.copy(response)
                     filtered_response.pnl_over_time = filtered_pnl
@@ -128,7 +115,7 @@ class PolymarketWalletNamespace(BasePlatformAPI):
                             at_time
                         )
                     return filtered_response
-            except (AttributeError, TypeError):
+            except (AttributeError, TypeError, ValueError):
                 # Fallback if copy fails - create simple response object
                 class FilteredResponse:
                     def __init__(self, pnl_over_time, granularity=None, start_time=None, end_time=None, wallet_address=None):
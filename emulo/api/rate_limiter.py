@@ -2,6 +2,8 @@
 
 Supports Free, Dev, and Enterprise tiers with configurable limits.
 Uses sliding window approach to track both per-second and per-10-second limits.
+A 429 response can pause the limiter so every namespace sharing it backs off
+together, rather than each one discovering the limit separately.
 """
 
 import asyncio
@@ -61,10 +63,60 @@ class RateLimiter:
                 "Enterprise tier requires custom limits. Provide qps and per_10s parameters."
             )
         
-        # Sliding windows: deque of timestamps
+        # Sliding windows: deques of monotonic timestamps
         self._recent_requests = deque()  # All requests in last 10 seconds
+        self._recent_1s = deque()  # Requests in last second (subset of the above)
+        self._paused_until = 0.0
         self._lock = asyncio.Lock()
     
+    def _expire(self, now: float):
+        """Drop timestamps that have left the sliding windows."""
+        while self._recent_requests and self._recent_requests[0] < now - 10:
+            self._recent_requests.popleft()
+        while self._recent_1s and self._recent_1s[0] < now - 1:
+            self._recent_1s.popleft()
+    
+    def pause(self, seconds: float):
+        """
+        Hold back all requests for `seconds`, e.g. after the server returned 429.
+        
+        Namespaces share one limiter, so a pause signalled by one request
+        stops the others from running into the same rate limit.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def update_from_headers(self, headers):
+        """
+        Back off proactively based on the server's rate-limit response headers.
+        
+        When X-RateLimit-Remaining drops below 10% of X-RateLimit-Limit, the
+        limiter pauses until the window resets (Retry-After or
+        X-RateLimit-Reset), instead of waiting to be told with a 429.
+        Responses without these headers are ignored.
+        
+        Args:
+            headers: Case-insensitive mapping of HTTP response headers
+        """
+        try:
+            remaining = int(headers.get('X-RateLimit-Remaining'))
+            limit = int(headers.get('X-RateLimit-Limit'))
+        except (TypeError, ValueError):
+            return
+        
+        if limit <= 0 or remaining >= limit * 0.1:
+            return
+        
+        try:
+            reset = float(headers.get('Retry-After') or headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return
+        
+        # X-RateLimit-Reset may be an epoch timestamp rather than a delay
+        if reset > 1e9:
+            reset -= time.time()
+        if reset > 0:
+            self.pause(reset)
+    
     async def acquire(self):
         """
         Wait until a request can be made without violating rate limits.
@@ -72,11 +124,14 @@ class RateLimiter:
         This method will block until both QPS and per-10-second limits are satisfied.
         """
         async with self._lock:
-            now = time.time()
+            now = time.monotonic()
             
-            # Clean up old requests (older than 10 seconds)
-            while self._recent_requests and self._recent_requests[0] < now - 10:
-                self._recent_requests.popleft()
+            # Honor a server-requested pause (429 retry-after)
+            if self._paused_until > now:
+                await asyncio.sleep(self._paused_until - now)
+                now = time.monotonic()
+            
+            self._expire(now)
             
             # Check per-10-second limit
             if len(self._recent_requests) >= self.per_10s_limit:
@@ -85,44 +140,38 @@ class RateLimiter:
                 wait_time = 10 - (now - oldest_time) + 0.01  # Small buffer
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
-                    now = time.time()
+                    now = time.monotonic()
                     # Clean up again after waiting
-                    while self._recent_requests and self._recent_requests[0] < now - 10:
-                        self._recent_requests.popleft()
+                    self._expire(now)
             
             # Check QPS limit (requests in last 1 second)
-            recent_1s = [t for t in self._recent_requests if t >= now - 1]
-            if len(recent_1s) >= self.qps_limit:
+            if len(self._recent_1s) >= self.qps_limit:
                 # Need to wait until oldest request in last second is 1 second old
-                oldest_1s = recent_1s[0]
+                oldest_1s = self._recent_1s[0]
                 wait_time = 1 - (now - oldest_1s) + 0.01  # Small buffer
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
-                    now = time.time()
+                    now = time.monotonic()
                     # Clean up old requests after waiting
-                    while self._recent_requests and self._recent_requests[0] < now - 10:
-                        self._recent_requests.popleft()
+                    self._expire(now)
             
             # Record this request
             self._recent_requests.append(now)
+            self._recent_1s.append(now)
     
     def get_stats(self) -> dict:
         """Get current rate limiter statistics."""
-        now = time.time()
-        
         # Clean up old requests
-        while self._recent_requests and self._recent_requests[0] < now - 10:
-            self._recent_requests.popleft()
-        
-        recent_1s = [t for t in self._recent_requests if t >= now - 1]
+        self._expire(time.monotonic())
+        current_qps = len(self._recent_1s)
         
         return {
             "tier": self.tier,
             "qps_limit": self.qps_limit,
             "per_10s_limit": self.per_10s_limit,
-            "current_qps": len(recent_1s),
+            "current_qps": current_qps,
             "current_per_10s": len(self._recent_requests),
-            "qps_remaining": max(0, self.qps_limit - len(recent_1s)),
+            "qps_remaining": max(0, self.qps_limit - current_qps),
             "per_10s_remaining": max(0, self.per_10s_limit - len(self._recent_requests))
         }
 
@@ -2,7 +2,7 @@ from .clock import SimulationClock
 from .portfolio import Portfolio, Position
 from .runner import BacktestRunner
 from .orderbook import OrderbookSimulator
-from .orders import OrderManager, SimulatedOrder, OrderStatus, normalize_side
+from .orders import OrderManager, SimulatedOrder, OrderStatus, normalize_side, to_decimal
 
 __all__ = [
     "SimulationClock",
@@ -14,4 +14,5 @@ __all__ = [
     "SimulatedOrder",
     "OrderStatus",
     "normalize_side",
+    "to_decimal",
 ]
@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List
 from enum import Enum
 
@@ -88,6 +89,24 @@ def normalize_side(side: str) -> str:
         raise ValueError(f"Invalid side: {side}. Must be 'buy'/'sell' or 'YES'/'NO'")
 
 
+@lru_cache(maxsize=4096)
+def _parse_decimal(text: str) -> Decimal:
+    """Parse a decimal string; Decimals are immutable, so cached results are shareable."""
+    return Decimal(text)
+
+
+def to_decimal(value) -> Decimal:
+    """
+    Convert a user-supplied quantity or price to Decimal, as Decimal(str(value)).
+    
+    Strategies tend to trade the same sizes at the same prices, so parsed
+    values are memoized by their string form; Decimals are passed through.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return _parse_decimal(str(value))
+
+
 class OrderManager:
     """Manages pending orders and order execution."""
     
@@ -24,6 +24,10 @@ setup(
         "dome-api-sdk>=0.1.7",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9"],
+        "http2": ["httpx[http2]>=0.24"],
+    },
     license="MIT",
     license_files=["LICENSE"],
     keywords=["polymarket", "kalshi", "prediction-markets", "backtesting", "trading"],
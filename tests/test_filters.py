@@ -0,0 +1,30 @@
+"""Tests for the backtest-time capping helpers in emulo.api.filters."""
+
+from types import SimpleNamespace
+
+from emulo.api.filters import filter_at_or_before
+
+
+def records(*timestamps):
+    return [SimpleNamespace(timestamp=ts) for ts in timestamps]
+
+
+def timestamps(items):
+    return [item.timestamp for item in items]
+
+
+def test_sorted_series_is_cut_at_cap():
+    assert timestamps(filter_at_or_before(records(1, 2, 3, 4, 5), 'timestamp', 3, order="asc")) == [1, 2, 3]
+    assert timestamps(filter_at_or_before(records(5, 4, 3, 2, 1), 'timestamp', 3, order="desc")) == [3, 2, 1]
+
+
+def test_out_of_order_middle_record_is_not_leaked():
+    # The ends look sorted, but a record past the cap sits in the middle
+    assert timestamps(filter_at_or_before(records(1, 9, 2, 3, 10), 'timestamp', 5, order="asc")) == [1, 2, 3]
+    assert timestamps(filter_at_or_before(records(10, 3, 9, 2, 1), 'timestamp', 5, order="desc")) == [3, 2, 1]
+
+
+def test_dicts_and_missing_timestamps_fall_back_to_scan():
+    items = [{'timestamp': 1}, {'timestamp': None}, {'timestamp': 2}, {'timestamp': 7}]
+
+    assert filter_at_or_before(items, 'timestamp', 5, order="asc") == [{'timestamp': 1}, {'timestamp': 2}]
@@ -0,0 +1,136 @@
+"""Tests for the shared get_markets window search (BasePlatformAPI._search_markets)."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+from emulo.api.base_api import search_windows, split_search_windows
+from emulo.api.polymarket.markets import PolymarketMarketsNamespace
+from emulo.api.rate_limiter import RateLimiter
+from emulo.simulation.clock import SimulationClock
+from emulo.simulation.portfolio import Portfolio
+
+DAY = 24 * 3600
+AT_TIME = 1_600_000_000
+
+
+def make_market(condition_id: str, start_time: int, close_time=None, status=None):
+    """A Polymarket SDK market with the fields HistoricalMarket.from_market reads."""
+    return SimpleNamespace(
+        market_slug='slug-' + condition_id,
+        condition_id=condition_id,
+        title=condition_id,
+        start_time=start_time,
+        end_time=close_time,
+        completed_time=None,
+        close_time=close_time,
+        game_start_time=None,
+        tags=[],
+        volume_1_week=0,
+        volume_1_month=0,
+        volume_1_year=0,
+        volume_total=0,
+        resolution_source='',
+        image='',
+        side_a=None,
+        side_b=None,
+        winning_side=None,
+        status=status or ('closed' if close_time else 'open'),
+    )
+
+
+def make_namespace(markets, filter_by_time: bool = True):
+    """
+    PolymarketMarketsNamespace over a fake get_markets.
+
+    Returns the namespace and the list each request's params are appended to.
+    With filter_by_time=False the fake ignores start_time/end_time, so every
+    window sees the same markets.
+    """
+    calls = []
+
+    async def get_markets(params):
+        calls.append(dict(params))
+        if filter_by_time:
+            listed = [
+                market for market in markets
+                if params['start_time'] <= market.start_time <= params['end_time']
+            ]
+        else:
+            listed = list(markets)
+        if 'status' in params:
+            listed = [market for market in listed if market.status == params['status']]
+        offset, limit = params.get('offset', 0), params['limit']
+        return SimpleNamespace(
+            markets=listed[offset:offset + limit],
+            pagination={'has_more': offset + limit < len(listed)},
+        )
+
+    client = SimpleNamespace(polymarket=SimpleNamespace(markets=SimpleNamespace(get_markets=get_markets)))
+    namespace = PolymarketMarketsNamespace(
+        client, SimulationClock(AT_TIME), Portfolio(Decimal(1000)), RateLimiter(tier="dev")
+    )
+    return namespace, calls
+
+
+def condition_ids(response):
+    return [market.condition_id for market in response.markets]
+
+
+def test_split_search_windows_edges_are_disjoint():
+    windows = search_windows(None, AT_TIME)
+    ranges = [bounds for step in split_search_windows(windows) for bounds in step]
+
+    ranges.sort()
+    for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end < next_start
+    assert ranges[0][0] == windows[-1][0]
+    assert ranges[-1][1] == windows[-1][1]
+
+
+def test_market_on_window_bound_is_returned_once():
+    markets = [
+        make_market('inner', AT_TIME - DAY),
+        make_market('bound', AT_TIME - 7 * DAY),
+        make_market('outer', AT_TIME - 10 * DAY),
+    ]
+    namespace, calls = make_namespace(markets)
+
+    response = asyncio.run(namespace.get_markets({'limit': 3}))
+
+    assert condition_ids(response) == ['inner', 'bound', 'outer']
+    # First window, then the second window's past and future edges
+    assert len(calls) == 3
+
+
+def test_duplicate_markets_still_end_an_edge_window():
+    # An API that returns the same 120 markets for every range: each edge
+    # repeats markets already found, which must still count towards the
+    # limit so the edge stops after its first page
+    markets = [make_market('C%d' % i, AT_TIME - DAY) for i in range(120)]
+    namespace, calls = make_namespace(markets, filter_by_time=False)
+
+    response = asyncio.run(namespace.get_markets({'limit': 150}))
+
+    assert condition_ids(response) == ['C%d' % i for i in range(120)]
+    # Two pages for the first window, one per edge for the five wider windows
+    assert len(calls) == 2 + 5 * 2
+
+
+def test_closed_search_keeps_api_order_and_limit():
+    # 'resolved' closed before the backtest time too, but a server-side
+    # status='closed' filter would drop it and let 'late' take its place
+    markets = [
+        make_market('resolved', AT_TIME - 3 * DAY, AT_TIME - 2 * DAY, status='resolved'),
+        make_market('still-open', AT_TIME - 3 * DAY),
+        make_market('early', AT_TIME - 4 * DAY, AT_TIME - DAY),
+        make_market('late', AT_TIME - 5 * DAY, AT_TIME - DAY),
+    ]
+    namespace, calls = make_namespace(markets)
+
+    response = asyncio.run(namespace.get_markets({'status': 'closed', 'limit': 2}))
+
+    assert condition_ids(response) == ['resolved', 'early']
+    assert all('status' not in params for params in calls)
+    # Two pages of two markets reach the limit; nothing is fetched twice
+    assert len(calls) == 2